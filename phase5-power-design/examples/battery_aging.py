@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+배터리 노화 및 자기 방전 장기 예측
+==================================
+딥 슬립 위주 설계처럼 배터리 수명이 수년에 이르는 경우,
+부하 전류보다 자기 방전과 용량 감소(노화)가 수명을 좌우합니다.
+이 모듈은 화학 종류별 자기 방전율과 달력/사이클 노화를 반영하여
+수명을 예측합니다.
+
+모델:
+  잔량 Q(mAh)는 다음 선형 미분방정식을 따릅니다.
+      dQ/dt = -a * Q - L
+      a = k(자기 방전) + λ(달력 노화) + φ * L / C0(사이클 노화)
+      L = 부하 전류 (mAh/일)
+  구간 안에서 a가 일정하면 닫힌 형태의 해가 있습니다.
+      Q(t + h) = (Q(t) + L/a) * e^(-a*h) - L/a
+  달력 노화는 경과 시간의 제곱근에 비례하므로(초반에 빠르고 점점 느려짐)
+  구간 길이를 1일, 2일, 4일 ... 로 두 배씩 늘려가며 계산합니다.
+  10년 예측도 20번 안팎의 지수 계산으로 끝납니다.
+
+사용법:
+  python power_budget_calculator.py --aging
+  python battery_aging.py
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+import math
+
+from power_budget_calculator import (
+    Battery,
+    COMMON_BATTERIES,
+    calculate_battery_life,
+    print_separator,
+)
+
+
+# =============================================================================
+# 화학 종류별 노화 특성
+# =============================================================================
+
+@dataclass
+class ChemistryAging:
+    """
+    배터리 화학 종류별 노화 특성 (25°C 기준).
+
+    Attributes:
+        name: 화학 종류 이름
+        self_discharge_per_month: 한 달 동안 자기 방전되는 잔량 비율
+        calendar_fade_per_sqrt_year: 달력 노화 계수 (1년 후 용량 감소 비율,
+            이후 경과 시간의 제곱근에 비례하여 증가)
+        cycle_fade_per_cycle: 완전 방전 1회(등가 사이클)당 용량 감소 비율
+    """
+    name: str
+    self_discharge_per_month: float
+    calendar_fade_per_sqrt_year: float
+    cycle_fade_per_cycle: float
+
+
+# 출처: 제조사 데이터시트 및 일반적인 문헌값 (대략적인 값)
+CHEMISTRY_AGING = {
+    "li-ion": ChemistryAging("리튬이온", 0.02, 0.05, 0.0004),
+    "lipo": ChemistryAging("리튬 폴리머", 0.03, 0.06, 0.0005),
+    "alkaline": ChemistryAging("알카라인", 0.002, 0.0, 0.0),
+    "lithium-primary": ChemistryAging("리튬 1차 전지", 0.001, 0.0, 0.0),
+}
+
+# chemistry가 비어 있는 배터리에 사용할 기본값
+DEFAULT_CHEMISTRY = "li-ion"
+
+# calculate_battery_life()와 같은 사용 가능 용량 비율 (방전 곡선, 컷오프 전압)
+USABLE_CAPACITY_RATIO = 0.8
+
+# 최대 구간 길이 (일) - 두 배씩 늘리다가 이 값에서 멈춤
+MAX_STEP_DAYS = 256.0
+
+DAYS_PER_MONTH = 30.4375
+DAYS_PER_YEAR = 365.25
+
+
+def get_chemistry(battery: Battery) -> ChemistryAging:
+    """
+    배터리의 화학 종류에 해당하는 노화 특성을 반환합니다.
+
+    chemistry가 비어 있으면 리튬이온으로 가정합니다.
+
+    Raises:
+        ValueError: 알 수 없는 화학 종류인 경우
+    """
+    key = battery.chemistry or DEFAULT_CHEMISTRY
+    if key not in CHEMISTRY_AGING:
+        raise ValueError(
+            f"알 수 없는 배터리 화학 종류: '{key}' "
+            f"(지원: {', '.join(CHEMISTRY_AGING)})"
+        )
+    return CHEMISTRY_AGING[key]
+
+
+# =============================================================================
+# 장기 수명 계산
+# =============================================================================
+
+def calculate_aged_battery_life(
+    total_current_ma: float,
+    battery: Battery,
+    duty_cycle: float = 1.0,
+    horizon_years: float = 10.0,
+    temperature_c: float = 25.0,
+) -> dict:
+    """
+    자기 방전과 용량 감소를 반영하여 배터리 수명을 예측합니다.
+
+    온도가 10°C 오를 때마다 자기 방전율과 달력 노화 속도가 두 배가 된다고
+    가정합니다 (아레니우스 경험 법칙). 각 구간 안에서는 닫힌 형태의 지수 해로
+    잔량을 계산하고, 잔량이 0이 되는 구간에서는 방전 시점을 정확히 풉니다.
+
+    Args:
+        total_current_ma: 총 전류 소비 (mA)
+        battery: 배터리 정보
+        duty_cycle: 듀티 사이클 (0.0~1.0, 1.0 = 항상 활성)
+        horizon_years: 예측 기간 (년)
+        temperature_c: 평균 주변 온도 (°C)
+
+    Returns:
+        수명 정보 딕셔너리 (일, 년, 손실 내역, 용량 유지율 등)
+    """
+    chem = get_chemistry(battery)
+    temp_factor = 2.0 ** ((temperature_c - 25.0) / 10.0)
+
+    capacity = battery.capacity_mah
+    charge = capacity * USABLE_CAPACITY_RATIO
+    load_per_day = max(total_current_ma * duty_cycle, 0.0) * 24.0
+    horizon_days = horizon_years * DAYS_PER_YEAR
+
+    k = -math.log(1.0 - chem.self_discharge_per_month) / DAYS_PER_MONTH * temp_factor
+    cycle_rate = chem.cycle_fade_per_cycle * load_per_day / capacity
+    fade_coeff = chem.calendar_fade_per_sqrt_year * temp_factor
+
+    def retention(days: float) -> float:
+        """경과 일수에 따른 용량 유지율 (1.0 = 새 배터리)"""
+        return max(1.0 - fade_coeff * math.sqrt(days / DAYS_PER_YEAR), 1e-6)
+
+    t = 0.0
+    step = 1.0
+    steps = 0
+    depleted = False
+    loss_self = loss_fade = loss_load = 0.0
+
+    while t < horizon_days:
+        h = min(step, horizon_days - t)
+        lam = math.log(retention(t) / retention(t + h)) / h
+        a = k + lam + cycle_rate
+        steps += 1
+
+        decay = math.exp(-a * h)
+        offset = load_per_day / a
+        next_charge = (charge + offset) * decay - offset
+
+        if next_charge <= 0.0:
+            # 이 구간 안에서 방전: Q(τ) = 0이 되는 τ를 닫힌 형태로 계산
+            h = math.log(1.0 + a * charge / load_per_day) / a
+            decay = math.exp(-a * h)
+            next_charge = 0.0
+            depleted = True
+
+        # 구간 동안의 잔량 적분 -> 원인별 손실량
+        integral = (charge + offset) * (1.0 - decay) / a - offset * h
+        loss_self += k * integral
+        loss_fade += (lam + cycle_rate) * integral
+        loss_load += load_per_day * h
+
+        t += h
+        charge = next_charge
+        if depleted:
+            break
+        step = min(step * 2.0, MAX_STEP_DAYS)
+
+    ideal = calculate_battery_life(total_current_ma, battery, duty_cycle)
+    days = t if depleted else float("inf")
+
+    return {
+        "battery_name": battery.name,
+        "chemistry": chem.name,
+        "capacity_mah": capacity,
+        "usable_capacity_mah": capacity * USABLE_CAPACITY_RATIO,
+        "effective_current_ma": round(total_current_ma * duty_cycle, 3),
+        "days": round(days, 2) if depleted else days,
+        "years": round(days / DAYS_PER_YEAR, 2) if depleted else days,
+        "ideal_days": ideal["days"],
+        "depleted": depleted,
+        "remaining_mah": round(charge, 2),
+        "load_mah": round(loss_load, 2),
+        "self_discharge_mah": round(loss_self, 2),
+        "fade_mah": round(loss_fade, 2),
+        "capacity_retention_percent": round(
+            retention(t) * (1.0 - chem.cycle_fade_per_cycle * loss_load / capacity) * 100.0, 1
+        ),
+        "steps": steps,
+    }
+
+
+def project_battery_catalog(
+    total_current_ma: float,
+    batteries: Sequence[Battery] = COMMON_BATTERIES,
+    duty_cycle: float = 1.0,
+    horizon_years: float = 10.0,
+    temperature_c: float = 25.0,
+) -> list[dict]:
+    """
+    배터리 목록 전체의 장기 수명을 예측합니다.
+
+    Args:
+        total_current_ma: 총 전류 소비 (mA)
+        batteries: 비교할 배터리 목록
+        duty_cycle: 듀티 사이클 (0.0~1.0)
+        horizon_years: 예측 기간 (년)
+        temperature_c: 평균 주변 온도 (°C)
+
+    Returns:
+        배터리별 수명 정보 목록
+    """
+    return [
+        calculate_aged_battery_life(
+            total_current_ma, bat, duty_cycle, horizon_years, temperature_c
+        )
+        for bat in batteries
+    ]
+
+
+# =============================================================================
+# 보고서 출력
+# =============================================================================
+
+def _format_days(days: float) -> str:
+    """수명(일)을 표시용 문자열로 변환합니다."""
+    if math.isinf(days):
+        return "기간 초과"
+    if days >= DAYS_PER_YEAR:
+        return f"{days / DAYS_PER_YEAR:.1f}년"
+    return f"{days:.1f}일"
+
+
+def print_aging_report(
+    currents_ma: Sequence[float] = (0.01, 0.05, 0.5, 5.0),
+    batteries: Sequence[Battery] = COMMON_BATTERIES,
+    horizon_years: float = 10.0,
+    temperature_c: float = 25.0,
+) -> None:
+    """
+    평균 전류별로 단순 계산과 노화 반영 수명을 비교하여 출력합니다.
+
+    Args:
+        currents_ma: 비교할 평균 전류 목록 (mA)
+        batteries: 비교할 배터리 목록
+        horizon_years: 예측 기간 (년)
+        temperature_c: 평균 주변 온도 (°C)
+    """
+    print()
+    print_separator("=")
+    print(f"  배터리 장기 수명 예측 (자기 방전 + 노화, {temperature_c:.0f}°C, 최대 {horizon_years:.0f}년)")
+    print_separator("=")
+
+    for current in currents_ma:
+        print()
+        print(f"[ 평균 전류 {current} mA ]")
+        print_separator("-")
+        print(f"  {'배터리 종류':<24} {'단순 계산':>10} {'노화 반영':>10} {'자기 방전':>10} {'노화 손실':>10}")
+        print(f"  {'-'*24} {'-'*10} {'-'*10} {'-'*10} {'-'*10}")
+        for r in project_battery_catalog(current, batteries, 1.0, horizon_years, temperature_c):
+            print(
+                f"  {r['battery_name']:<24} {_format_days(r['ideal_days']):>10} "
+                f"{_format_days(r['days']):>10} "
+                f"{r['self_discharge_mah']:>8.0f}mAh {r['fade_mah']:>8.0f}mAh"
+            )
+
+    print()
+    print("  * 평균 전류가 작을수록 자기 방전이 수명을 결정합니다 (딥 슬립 0.01mA 등).")
+    print("  * 장기 설치에는 자기 방전이 적은 리튬 1차 전지나 알카라인이 유리할 수 있습니다.")
+    print("  * 고온 환경(여름철 실외 함체 등)에서는 자기 방전과 노화가 크게 빨라집니다.")
+    print()
+
+
+if __name__ == "__main__":
+    print_aging_report()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+전력 예산 JSON 요청 처리
+========================
+부품 목록을 JSON으로 받아 전력 예산을 계산합니다. budget_service.py의
+HTTP 서비스와 power_budget_calculator.py --json 명령이 함께 사용합니다.
+
+CI처럼 계산기를 수천 번 새로 실행하는 환경에서는 계산보다 인터프리터와
+모듈 초기화 시간이 더 깁니다. 그래서 이 모듈은 asyncio, multiprocessing 같은
+무거운 모듈을 불러오지 않고 json과 계산기 본체만 사용합니다.
+
+요청 형식 (components 항목은 세 가지 형식 중 하나):
+  {"components": [
+      {"esp32": "active_wifi"},
+      {"catalog": "sht30", "quantity": 1},
+      {"name": "팬", "voltage": 5.0, "current_ma": 120.0, "quantity": 1}
+   ],
+   "vin": 5.0, "vout": 3.3, "duty_cycle": 1.0}
+
+  여러 부품 목록은 {"items": [요청, 요청, ...]} 형식으로 한 번에 계산합니다.
+
+사용법:
+  python power_budget_calculator.py --json bom.json
+  echo '{"components":[{"esp32":"deep_sleep"}]}' | python power_budget_calculator.py --json -
+"""
+
+import json
+import math
+import sys
+
+from power_budget_calculator import (
+    Component,
+    COMMON_BATTERIES,
+    COMPONENT_CATALOG,
+    ESP32_MODES,
+    apply_safety_margin,
+    calculate_battery_life,
+    calculate_heat_dissipation,
+    calculate_total_current,
+    calculate_total_power,
+    recommend_power_supply,
+)
+
+
+# =============================================================================
+# 요청 해석과 계산 (서비스의 프로세스 풀에서도 실행되므로 모듈 최상위 함수로 정의)
+# =============================================================================
+
+def _finite(value, name: str) -> float:
+    """
+    값을 유한한 실수로 변환합니다.
+
+    Raises:
+        ValueError: 숫자가 아니거나 NaN/무한대인 경우 (JSON으로 응답할 수 없음)
+    """
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{name} 값은 유한한 숫자여야 합니다: {value!r}")
+    return number
+
+
+def parse_component(item: dict) -> Component:
+    """
+    JSON 부품 항목을 Component로 변환합니다.
+
+    지원 형식:
+      {"esp32": "<ESP32_MODES 키>"}
+      {"catalog": "<COMPONENT_CATALOG 키>", "quantity": n}
+      {"name": ..., "voltage": ..., "current_ma": ..., "quantity": n, "mode": ...}
+
+    Raises:
+        ValueError: 알 수 없는 카탈로그 키이거나 필수 값이 없거나,
+            숫자 값이 유한하지 않거나 수량이 정수가 아니거나 전류가 음수인 경우
+    """
+    if not isinstance(item, dict):
+        raise ValueError(f"부품 항목은 객체여야 합니다: {item!r}")
+    quantity = _finite(item.get("quantity", 1), "quantity")
+    if not quantity.is_integer():
+        raise ValueError(f"수량은 정수여야 합니다: {item['quantity']!r}")
+    quantity = int(quantity)
+    if quantity < 1:
+        raise ValueError("수량은 1 이상이어야 합니다.")
+
+    if "esp32" in item:
+        key = item["esp32"]
+        if key not in ESP32_MODES:
+            raise ValueError(f"알 수 없는 ESP32 모드: '{key}' (지원: {', '.join(ESP32_MODES)})")
+        return ESP32_MODES[key].replace(quantity=quantity)
+    if "catalog" in item:
+        key = item["catalog"]
+        if key not in COMPONENT_CATALOG:
+            raise ValueError(f"알 수 없는 부품: '{key}' (지원: {', '.join(COMPONENT_CATALOG)})")
+        return COMPONENT_CATALOG[key].replace(quantity=quantity)
+    try:
+        component = Component(
+            name=str(item["name"]),
+            voltage=_finite(item["voltage"], "voltage"),
+            current_ma=_finite(item["current_ma"], "current_ma"),
+            quantity=quantity,
+            mode=str(item.get("mode", "")),
+            note=str(item.get("note", "")),
+        )
+    except KeyError as e:
+        raise ValueError(f"부품 항목에 {e.args[0]} 값이 없습니다.") from None
+    if component.current_ma < 0:
+        raise ValueError(f"current_ma는 0 이상이어야 합니다: {component.current_ma}")
+    return component
+
+
+def normalize_request(payload: dict) -> dict:
+    """
+    요청을 정규화합니다. 같은 부품 목록은 항상 같은 결과가 되므로
+    정규화된 요청을 JSON으로 직렬화한 문자열을 coalescing 키로 사용합니다.
+
+    Raises:
+        ValueError: 요청 형식이 잘못된 경우
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("components"), list):
+        raise ValueError("요청에는 components 목록이 필요합니다.")
+    components = [parse_component(item) for item in payload["components"]]
+    if not components:
+        raise ValueError("components 목록이 비어 있습니다.")
+    duty_cycle = _finite(payload.get("duty_cycle", 1.0), "duty_cycle")
+    if not 0.0 < duty_cycle <= 1.0:
+        raise ValueError("duty_cycle은 0보다 크고 1 이하여야 합니다.")
+    return {
+        "components": [c.to_dict() for c in components],
+        "vin": _finite(payload.get("vin", 5.0), "vin"),
+        "vout": _finite(payload.get("vout", 3.3), "vout"),
+        "duty_cycle": duty_cycle,
+    }
+
+
+def request_key(normalized: dict) -> str:
+    """정규화된 요청의 coalescing 키를 만듭니다."""
+    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def compute_budget(normalized: dict) -> dict:
+    """
+    정규화된 요청 하나의 전력 예산을 계산합니다.
+
+    Returns:
+        총 전류/전력, 추천 전원, 배터리 수명, 발열 정보 딕셔너리
+    """
+    components = [Component(**c) for c in normalized["components"]]
+    vin, vout = normalized["vin"], normalized["vout"]
+    total_current = calculate_total_current(components)
+
+    return {
+        "total_current_ma": round(total_current, 3),
+        "total_power_mw": round(calculate_total_power(components), 2),
+        "margin_current_ma": round(apply_safety_margin(total_current), 3),
+        "power_supplies": [ps.to_dict() for ps in recommend_power_supply(total_current)],
+        "battery_life": [
+            calculate_battery_life(total_current, bat, normalized["duty_cycle"])
+            for bat in COMMON_BATTERIES
+        ],
+        "heat": calculate_heat_dissipation(vin, vout, total_current),
+    }
+
+
+def compute_batch(normalized_items: list[dict]) -> list[dict]:
+    """
+    여러 요청을 한꺼번에 계산합니다 (프로세스 풀 작업 함수).
+
+    배치 안에서 같은 부품 목록은 한 번만 계산합니다.
+    """
+    results: dict[str, dict] = {}
+    out = []
+    for item in normalized_items:
+        key = request_key(item)
+        if key not in results:
+            results[key] = compute_budget(item)
+        out.append(results[key])
+    return out
+
+
+# =============================================================================
+# 명령줄 실행
+# =============================================================================
+
+def run_json_request(args: list[str]) -> int:
+    """
+    JSON 파일(또는 표준 입력)의 요청을 계산하여 결과를 JSON으로 출력합니다.
+
+    Args:
+        args: [파일 경로] 또는 ["-"] (없으면 표준 입력)
+
+    Returns:
+        종료 코드 (0: 성공, 1: 요청 오류)
+    """
+    path = args[0] if args else "-"
+    try:
+        if path == "-":
+            payload = json.load(sys.stdin)
+        else:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+
+        if isinstance(payload, dict) and "items" in payload:
+            if not isinstance(payload["items"], list):
+                raise ValueError("items는 요청 목록이어야 합니다.")
+            result = {"results": compute_batch([normalize_request(p) for p in payload["items"]])}
+        else:
+            result = compute_budget(normalize_request(payload))
+    except (OSError, ValueError, TypeError) as e:
+        # json.JSONDecodeError는 ValueError의 하위 클래스
+        print(json.dumps({"error": str(e)}, ensure_ascii=False), file=sys.stderr)
+        return 1
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_json_request(sys.argv[1:]))
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+전력 예산 로컬 서비스 (asyncio HTTP/JSON)
+=========================================
+요청마다 power_budget_calculator.py를 새로 실행하면 인터프리터 시작과
+카탈로그 생성 비용을 매번 치르게 됩니다. 이 서비스는 카탈로그를 메모리에
+올려 둔 채 로컬 포트(또는 Unix 소켓)에서 JSON 요청을 처리합니다.
+
+주요 기능:
+  - POST /budget  : 부품 목록 하나의 전력 예산 계산
+  - POST /batch   : 여러 부품 목록을 프로세스 풀에서 일괄 계산
+  - GET  /health  : 상태, 요청 수, 지연 시간 백분위수(p50/p90/p99)
+  - 같은 부품 목록에 대한 동시 요청은 한 번만 계산하고 결과를 공유 (coalescing)
+
+요청 형식은 budget_request.py를 참고하세요. 예시:
+  {"components": [
+      {"esp32": "active_wifi"},
+      {"catalog": "sht30", "quantity": 1},
+      {"name": "팬", "voltage": 5.0, "current_ma": 120.0, "quantity": 1}
+   ],
+   "vin": 5.0, "vout": 3.3, "duty_cycle": 1.0}
+
+사용법:
+  python power_budget_calculator.py --serve              # 127.0.0.1:8765
+  python power_budget_calculator.py --serve 9000         # 포트 지정
+  python power_budget_calculator.py --serve unix:/tmp/budget.sock
+
+  curl -s localhost:8765/health
+  curl -s -d '{"components":[{"esp32":"active_wifi"}]}' localhost:8765/budget
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import contextlib
+import json
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+from budget_request import (
+    compute_batch,
+    compute_budget,
+    normalize_request,
+    request_key,
+)
+
+
+# =============================================================================
+# 설정
+# =============================================================================
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 요청 본문 최대 크기 (바이트)
+MAX_BODY_BYTES = 4 * 1024 * 1024
+
+# 부품 수가 이보다 많은 단일 요청은 프로세스 풀에서 계산
+INLINE_COMPONENT_LIMIT = 500
+
+# 지연 시간 백분위수 계산에 사용할 최근 요청 수
+LATENCY_WINDOW = 2048
+
+# 연결 유지(keep-alive) 중 다음 요청을 기다리는 최대 시간 (초)
+KEEP_ALIVE_TIMEOUT = 15.0
+
+_STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+class RequestError(Exception):
+    """클라이언트 요청 오류 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# =============================================================================
+# 서비스
+# =============================================================================
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """정렬된 목록의 p 백분위수 (nearest-rank 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(p / 100.0 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+class BudgetService:
+    """
+    전력 예산 HTTP/JSON 서비스.
+
+    같은 키의 계산이 진행 중이면 새로 계산하지 않고 진행 중인 Future를
+    함께 기다립니다. 무거운 계산(배치, 큰 부품 목록)은 프로세스 풀에서
+    실행하여 이벤트 루프가 다른 요청을 계속 받을 수 있게 합니다.
+    작은 부품 목록은 바로 계산하되, 계산 전에 이벤트 루프에 한 번 양보하여
+    동시에 들어온 같은 요청도 결과를 공유합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.started_at = time.monotonic()
+        self.request_count = 0
+        self.error_count = 0
+        self.coalesced_count = 0
+        self.computed_count = 0
+
+    # ----- 계산 실행 -----
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """프로세스 풀은 처음 필요할 때 만듭니다."""
+        if self._pool is None:
+            # fork로 만든 작업자는 열린 클라이언트 소켓을 물려받아 연결 종료(EOF)를
+            # 막으므로, 깨끗한 프로세스에서 시작하는 forkserver/spawn을 사용
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._pool
+
+    async def _coalesce(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """같은 키의 계산이 진행 중이면 그 결과를 공유합니다."""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced_count += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 쪽이 없을 때 "예외를 가져가지 않음" 경고가 나오지 않도록 처리
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            self.computed_count += 1
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def budget(self, payload: dict) -> dict:
+        """POST /budget 처리"""
+        normalized = normalize_request(payload)
+        key = request_key(normalized)
+
+        async def compute() -> dict:
+            if len(normalized["components"]) > INLINE_COMPONENT_LIMIT:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_pool(), compute_budget, normalized)
+            # 작은 부품 목록은 await 없이 바로 끝나서 다른 요청과 겹칠 틈이 없으므로,
+            # 이벤트 루프에 한 번 양보하여 같은 순간 도착한 같은 요청이 합류하게 함
+            await asyncio.sleep(0)
+            return compute_budget(normalized)
+
+        return await self._coalesce(key, compute)
+
+    async def batch(self, payload: dict) -> dict:
+        """POST /batch 처리: 항목을 작업자 수만큼 나누어 프로세스 풀에서 계산"""
+        items = payload.get("items") if isinstance(payload, dict) else None
+        if not isinstance(items, list) or not items:
+            raise ValueError("요청에는 비어 있지 않은 items 목록이 필요합니다.")
+        normalized = [normalize_request(item) for item in items]
+        key = "batch:" + request_key({"items": normalized})
+
+        async def compute() -> list[dict]:
+            loop = asyncio.get_running_loop()
+            pool = self._get_pool()
+            n_chunks = max(1, min(len(normalized), self.workers or os.cpu_count() or 1))
+            size = -(-len(normalized) // n_chunks)
+            chunks = [normalized[i:i + size] for i in range(0, len(normalized), size)]
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(pool, compute_batch, chunk) for chunk in chunks
+            ))
+            return [r for part in parts for r in part]
+
+        return {"results": await self._coalesce(key, compute)}
+
+    def health(self) -> dict:
+        """GET /health 처리"""
+        latencies = sorted(self._latencies)
+        return {
+            "status": "ok",
+            "uptime_s": round(time.monotonic() - self.started_at, 1),
+            "requests": self.request_count,
+            "errors": self.error_count,
+            "computed": self.computed_count,
+            "coalesced": self.coalesced_count,
+            "inflight": len(self._inflight),
+            "latency_ms": {
+                "samples": len(latencies),
+                "p50": round(percentile(latencies, 50), 3),
+                "p90": round(percentile(latencies, 90), 3),
+                "p99": round(percentile(latencies, 99), 3),
+                "max": round(latencies[-1], 3) if latencies else 0.0,
+            },
+        }
+
+    # ----- HTTP 처리 -----
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        """경로와 메서드에 맞는 처리 함수를 호출합니다."""
+        path = path.split("?", 1)[0]
+        if path in ("/health", "/metrics"):
+            if method != "GET":
+                raise RequestError(405, "GET만 지원합니다.")
+            return 200, self.health()
+
+        handlers = {"/budget": self.budget, "/batch": self.batch}
+        if path not in handlers:
+            raise RequestError(404, f"알 수 없는 경로: {path}")
+        if method != "POST":
+            raise RequestError(405, "POST만 지원합니다.")
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError as e:
+            raise RequestError(400, f"JSON 형식 오류: {e}") from None
+        try:
+            return 200, await handlers[path](payload)
+        except (ValueError, TypeError) as e:
+            raise RequestError(400, str(e)) from None
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """연결 하나에서 HTTP/1.1 요청을 차례로 처리합니다 (keep-alive 지원)."""
+        try:
+            while True:
+                # 한 줄이 StreamReader 한도(64 KiB)를 넘으면 readline()이 ValueError를
+                # 일으킵니다. 남은 입력을 신뢰할 수 없으므로 오류로 응답하고 연결을 닫습니다.
+                head_error: Optional[RequestError] = None
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    request_line, head_error = b"", RequestError(400, "요청 줄이 너무 깁니다.")
+                if not request_line and head_error is None:
+                    break
+
+                start = time.perf_counter()
+                headers: dict[str, str] = {}
+                try:
+                    while head_error is None:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                except (ValueError, asyncio.LimitOverrunError):
+                    head_error = RequestError(431, "요청 헤더가 너무 깁니다.")
+
+                keep_alive = head_error is None and headers.get("connection", "").lower() != "close"
+                try:
+                    if head_error is not None:
+                        raise head_error
+                    parts = request_line.decode("latin-1").split()
+                    if len(parts) < 2:
+                        raise RequestError(400, "잘못된 요청 줄입니다.")
+                    method, path = parts[0].upper(), parts[1]
+                    try:
+                        length = int(headers.get("content-length", "0") or 0)
+                    except ValueError:
+                        length = -1
+                    if length < 0:
+                        keep_alive = False
+                        raise RequestError(400, "Content-Length 값이 잘못되었습니다.")
+                    if length > MAX_BODY_BYTES:
+                        keep_alive = False
+                        raise RequestError(413, "요청 본문이 너무 큽니다.")
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self.dispatch(method, path, body)
+                except RequestError as e:
+                    status, response = e.status, {"error": str(e)}
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as e:  # 서비스는 계속 동작해야 하므로 500으로 응답
+                    status, response = 500, {"error": f"{type(e).__name__}: {e}"}
+
+                self.request_count += 1
+                if status >= 400:
+                    self.error_count += 1
+                data = json.dumps(response, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode("latin-1") + data
+                )
+                await writer.drain()
+                self._latencies.append((time.perf_counter() - start) * 1000.0)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self) -> None:
+        """프로세스 풀을 정리합니다."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    ready: Optional[Callable[[asyncio.AbstractServer], None]] = None,
+) -> None:
+    """
+    서비스를 시작하고 종료될 때까지 요청을 처리합니다.
+
+    Args:
+        host: 바인딩할 주소 (기본값: 로컬 전용 127.0.0.1)
+        port: TCP 포트 (0이면 임의 포트)
+        unix_path: 지정하면 TCP 대신 Unix 소켓 사용
+        workers: 프로세스 풀 작업자 수 (None = CPU 수)
+        ready: 서버가 준비되면 호출할 함수 (테스트/임베딩용)
+    """
+    service = BudgetService(workers=workers)
+    if unix_path:
+        server = await asyncio.start_unix_server(service.handle_connection, path=unix_path)
+        where = f"unix:{unix_path}"
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        bound = server.sockets[0].getsockname()
+        where = f"http://{bound[0]}:{bound[1]}"
+
+    # SIGTERM(서비스 관리자, CI 종료 등)도 Ctrl+C처럼 정리 후 종료
+    loop = asyncio.get_running_loop()
+    with contextlib.suppress(NotImplementedError):
+        loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
+    print(f"  전력 예산 서비스 시작: {where}  (종료: Ctrl+C)")
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+# =============================================================================
+# 로컬 클라이언트
+# =============================================================================
+
+async def fetch(
+    method: str,
+    path: str,
+    payload: Optional[dict] = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_path: Optional[str] = None,
+) -> tuple[int, dict]:
+    """
+    서비스에 요청 하나를 보내고 (상태 코드, 응답 JSON)을 반환합니다.
+
+    TCP와 Unix 소켓을 모두 지원하는 최소한의 HTTP 클라이언트입니다.
+    """
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+    writer.write(
+        (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        ).encode("latin-1") + body
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+
+    head, _, content = raw.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    return status, json.loads(content or b"null")
+
+
+def request(method: str, path: str, payload: Optional[dict] = None, **kwargs) -> tuple[int, dict]:
+    """fetch()의 동기 버전입니다."""
+    return asyncio.run(fetch(method, path, payload, **kwargs))
+
+
+def run_service(args: list[str]) -> None:
+    """
+    명령줄 인수로 서비스를 시작합니다.
+
+    Args:
+        args: [포트] 또는 ["unix:/소켓/경로"] (없으면 기본 포트)
+    """
+    port, unix_path = DEFAULT_PORT, None
+    if args:
+        if args[0].startswith("unix:"):
+            unix_path = args[0][len("unix:"):]
+        else:
+            port = int(args[0])
+    try:
+        asyncio.run(serve(port=port, unix_path=unix_path))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n  서비스를 종료합니다.")
+
+
+if __name__ == "__main__":
+    run_service(sys.argv[1:])
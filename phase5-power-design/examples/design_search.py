@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+전원 구성 설계 공간 탐색
+========================
+부품 목록(BOM)과 제약 조건이 주어지면 전원 공급 장치 x 배터리 x
+레귤레이터 x 입력 전압 조합 중에서 조건을 만족하는 구성을 찾고,
+비용 / 배터리 수명 / 레귤레이터 발열의 파레토 최적 구성을 반환합니다.
+
+제약 조건:
+  - 최소 배터리 수명 (시간)
+  - 최대 레귤레이터 발열 (W)
+  - 전원 공급 장치 최대 사용률 (안전 여유율 적용 전류 / 정격 전류)
+
+탐색 방법 (전체 조합을 만들지 않음):
+  각 목표값은 일부 선택에만 의존합니다.
+    - 발열          : 레귤레이터, 입력 전압
+    - 배터리 수명   : 레귤레이터, 배터리
+    - 전원 사용률   : 레귤레이터, 입력 전압, 전원 공급 장치
+  1) (레귤레이터, 입력 전압) 쌍마다 발열 상한으로 먼저 가지치기하고,
+     가능한 입력 전압이 없는 레귤레이터는 배터리를 보지 않고 건너뜀
+  2) 전원 공급 장치는 전압별로 정격 전류 순으로 정렬하고 "이 전류 이상 중
+     최저가" 인덱스를 만들어, 필요한 전류로 이분 탐색하여 가장 싼 것만 선택
+     (전원은 수명/발열에 영향이 없으므로 가장 싼 것 외에는 파레토 후보가 아님)
+  3) 배터리는 (비용, 수명) 2차원 파레토 목록으로 줄임. 레귤레이터가 받는
+     배터리 전압은 정렬된 전압 목록의 연속 구간이고, 구간 안에서 수명 순서는
+     LDO면 용량, 벅이면 용량 x 전압 순서로 레귤레이터와 무관하므로
+     파레토 목록은 전압 구간마다 한 번만 만들어 공유함
+  4) 남은 후보만 모아 3차원 파레토 필터 적용
+
+사용법:
+  python power_budget_calculator.py --design
+  python design_search.py
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Optional, Sequence
+import re
+
+from power_budget_calculator import (
+    Battery,
+    Component,
+    COMMON_BATTERIES,
+    POWER_SUPPLIES,
+    PowerSupply,
+    apply_safety_margin,
+    build_example_components,
+    calculate_battery_life,
+    calculate_heat_dissipation,
+    calculate_total_current,
+    print_separator,
+)
+
+
+# =============================================================================
+# 레귤레이터 카탈로그
+# =============================================================================
+
+@dataclass
+class Regulator:
+    """
+    전압 레귤레이터 정보.
+
+    Attributes:
+        name: 레귤레이터 이름
+        kind: 종류 ('ldo' = 리니어, 'buck' = DC-DC 벅 컨버터)
+        dropout_v: 최소 입출력 전압 차이 (V)
+        max_vin: 최대 입력 전압 (V)
+        max_current_ma: 최대 출력 전류 (mA)
+        efficiency: 변환 효율 (벅 컨버터만 사용, 0.0~1.0)
+        price_range: 대략적인 가격대
+    """
+    name: str
+    kind: str
+    dropout_v: float
+    max_vin: float
+    max_current_ma: float
+    efficiency: float = 1.0
+    price_range: str = ""
+
+
+REGULATORS = [
+    Regulator("AMS1117-3.3 (LDO)", "ldo", 1.1, 15.0, 1000, price_range="300~700원"),
+    Regulator("AP2112K-3.3 (LDO)", "ldo", 0.25, 6.0, 600, price_range="500~1,000원"),
+    Regulator("HT7333 (LDO)", "ldo", 0.09, 12.0, 250, price_range="300~600원"),
+    Regulator("MP1584 (DC-DC 벅)", "buck", 0.8, 28.0, 3000, 0.90, "1,500~3,000원"),
+    Regulator("LM2596 (DC-DC 벅)", "buck", 1.5, 40.0, 3000, 0.85, "2,000~4,000원"),
+]
+
+_NUMBER = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+
+def parse_price(price_range: str) -> Optional[float]:
+    """
+    가격대 문자열에서 대표 가격(최저~최고의 중간값, 원)을 구합니다.
+
+    예: "5,000~8,000원" -> 6500.0, "3000원" -> 3000.0
+
+    Returns:
+        대표 가격 (숫자가 없으면 None)
+    """
+    values = [float(n.replace(",", "")) for n in _NUMBER.findall(price_range)]
+    if not values:
+        return None
+    return (min(values) + max(values)) / 2.0
+
+
+# =============================================================================
+# 목표값 계산
+# =============================================================================
+
+def regulator_input_current(regulator: Regulator, vin: float, vout: float, current_ma: float) -> float:
+    """
+    레귤레이터 입력 전류를 계산합니다 (mA).
+
+    LDO는 입력 전류 = 출력 전류, 벅 컨버터는 전력 보존에서
+    I_in = Vout x I_out / (효율 x Vin) 입니다.
+    """
+    if regulator.kind == "buck":
+        return vout * current_ma / (regulator.efficiency * vin)
+    return current_ma
+
+
+def regulator_heat_w(regulator: Regulator, vin: float, vout: float, current_ma: float) -> float:
+    """
+    레귤레이터 발열을 계산합니다 (W).
+
+    LDO는 calculate_heat_dissipation()과 같은 (Vin - Vout) x I,
+    벅 컨버터는 출력 전력 x (1/효율 - 1) 입니다.
+    """
+    if regulator.kind == "buck":
+        return vout * current_ma / 1000.0 * (1.0 / regulator.efficiency - 1.0)
+    return calculate_heat_dissipation(vin, vout, current_ma)["heat_dissipation_w"]
+
+
+def regulator_accepts(regulator: Regulator, vin: float, vout: float, current_ma: float) -> bool:
+    """레귤레이터가 이 입력 전압과 출력 전류로 동작할 수 있는지 확인합니다."""
+    return (
+        vout + regulator.dropout_v <= vin <= regulator.max_vin
+        and current_ma <= regulator.max_current_ma
+    )
+
+
+@dataclass
+class _SupplyIndex:
+    """
+    한 전압의 전원 공급 장치 인덱스.
+
+    max_currents는 정격 전류 오름차순이고, cheapest[i]는 i번째 이후
+    (정격 전류가 max_currents[i] 이상인) 전원 중 가장 싼 것입니다.
+    """
+    max_currents: list[float]
+    cheapest: list[tuple[float, PowerSupply]]
+
+    def cheapest_at_least(self, current_ma: float) -> Optional[tuple[float, PowerSupply]]:
+        """정격 전류가 current_ma 이상인 전원 중 가장 싼 것 (없으면 None)"""
+        i = bisect_left(self.max_currents, current_ma)
+        return self.cheapest[i] if i < len(self.cheapest) else None
+
+
+def _build_supply_index(supplies: Sequence[PowerSupply]) -> dict[float, _SupplyIndex]:
+    """전원 공급 장치를 전압별로 묶고 정격 전류 순 + 뒤에서부터의 최저가 인덱스를 만듭니다."""
+    by_voltage: dict[float, list[tuple[float, float, PowerSupply]]] = {}
+    for ps in supplies:
+        price = parse_price(ps.price_range)
+        if price is not None:
+            by_voltage.setdefault(ps.voltage, []).append((ps.max_current_ma, price, ps))
+
+    index = {}
+    for voltage, entries in by_voltage.items():
+        entries.sort(key=lambda e: e[0])
+        cheapest: list[tuple[float, PowerSupply]] = []
+        for _, price, ps in reversed(entries):
+            if not cheapest or price < cheapest[-1][0]:
+                cheapest.append((price, ps))
+            else:
+                cheapest.append(cheapest[-1])
+        cheapest.reverse()
+        index[voltage] = _SupplyIndex([e[0] for e in entries], cheapest)
+    return index
+
+
+def _battery_candidates(
+    batteries: Sequence[tuple[float, Battery]],
+    min_voltage: float,
+    max_voltage: float,
+    buck: bool,
+) -> list[tuple[float, Battery]]:
+    """
+    전압 구간 [min_voltage, max_voltage]의 배터리를 (비용, 수명) 파레토 후보로 줄입니다.
+
+    레귤레이터 출력 전류가 같으면 수명은 LDO에서 용량에, 벅 컨버터에서
+    용량 x 전압에 비례합니다 (효율은 모든 배터리에 같은 배율). 그래서 이
+    값이 앞선(더 싼) 배터리보다 커지는 배터리만 어떤 레귤레이터에서도
+    파레토 최적이 될 수 있습니다. 부동소수점 오차로 후보를 놓치지 않도록
+    아주 작은 여유를 두며, 정확한 수명 비교는 _battery_front()에서 합니다.
+
+    Args:
+        batteries: (가격, 배터리) 목록, 가격 오름차순
+
+    Returns:
+        (가격, 배터리) 후보 목록, 가격 오름차순
+    """
+    candidates = []
+    best = -1.0
+    for price, bat in batteries:
+        if not min_voltage <= bat.voltage <= max_voltage:
+            continue
+        score = bat.capacity_mah * bat.voltage if buck else bat.capacity_mah
+        if score <= best * (1.0 - 1e-9):
+            continue
+        best = max(best, score)
+        candidates.append((price, bat))
+    return candidates
+
+
+def _battery_front(
+    regulator: Regulator,
+    batteries: Sequence[tuple[float, Battery]],
+    vout: float,
+    current_ma: float,
+    duty_cycle: float,
+    min_lifetime_hours: float,
+) -> list[tuple[float, float, Battery]]:
+    """
+    한 레귤레이터에 대해 (비용, 수명) 파레토 최적 배터리 목록을 구합니다.
+
+    batteries는 가격 오름차순이어야 하며(보통 _battery_candidates()의 결과),
+    결과도 가격 오름차순 (수명은 엄격히 증가)입니다.
+
+    Returns:
+        [(가격, 수명(시간), 배터리), ...]
+    """
+    front = []
+    best_life = -1.0
+    for price, bat in batteries:
+        if not regulator_accepts(regulator, bat.voltage, vout, current_ma):
+            continue
+        battery_current = regulator_input_current(regulator, bat.voltage, vout, current_ma)
+        life = calculate_battery_life(battery_current, bat, duty_cycle)["hours"]
+        if life < min_lifetime_hours or life <= best_life:
+            continue
+        best_life = life
+        front.append((price, life, bat))
+    return front
+
+
+def _pareto_filter(candidates: list[dict]) -> list[dict]:
+    """
+    (비용 최소, 수명 최대, 발열 최소) 파레토 최적 구성만 남깁니다.
+
+    비용 오름차순으로 정렬한 뒤, 이미 남은 구성 중 하나라도 이 구성을
+    지배하면 버립니다. 앞쪽 구성은 비용이 같거나 낮으므로 뒤쪽 구성이
+    앞쪽을 지배하는 경우는 비용이 같을 때뿐이며, 정렬 키로 이를 처리합니다.
+    """
+    candidates.sort(key=lambda c: (c["cost_won"], -c["lifetime_hours"], c["heat_w"]))
+    front: list[dict] = []
+    for c in candidates:
+        dominated = any(
+            f["lifetime_hours"] >= c["lifetime_hours"] and f["heat_w"] <= c["heat_w"]
+            for f in front
+        )
+        if not dominated:
+            front.append(c)
+    return front
+
+
+# =============================================================================
+# 설계 공간 탐색
+# =============================================================================
+
+def search_power_designs(
+    components: Sequence[Component],
+    min_lifetime_hours: float = 0.0,
+    max_heat_w: float = 1.0,
+    max_utilization: float = 0.8,
+    vout: float = 3.3,
+    duty_cycle: float = 1.0,
+    supplies: Sequence[PowerSupply] = POWER_SUPPLIES,
+    batteries: Sequence[Battery] = COMMON_BATTERIES,
+    regulators: Sequence[Regulator] = REGULATORS,
+    input_voltages: Optional[Sequence[float]] = None,
+) -> list[dict]:
+    """
+    제약 조건을 만족하는 전원 구성의 파레토 최적 집합을 찾습니다.
+
+    구성 하나는 (전원 공급 장치, 배터리, 레귤레이터, 입력 전압)이며,
+    전원 공급 장치는 입력 전압과 같은 전압을 출력해야 합니다.
+    배터리는 같은 레귤레이터를 거쳐 부하에 전원을 공급한다고 봅니다
+    (정전 시 백업 또는 휴대용 동작). 가격 정보가 없는 항목은 제외합니다.
+
+    Args:
+        components: 부품 목록
+        min_lifetime_hours: 최소 배터리 수명 (시간)
+        max_heat_w: 최대 레귤레이터 발열 (W)
+        max_utilization: 전원 공급 장치 최대 사용률 (0.0~1.0, 안전 여유율 포함 기준)
+        vout: 레귤레이터 출력 전압 (V)
+        duty_cycle: 듀티 사이클 (0.0~1.0)
+        supplies: 전원 공급 장치 후보
+        batteries: 배터리 후보
+        regulators: 레귤레이터 후보
+        input_voltages: 입력 전압 후보 (None이면 전원 공급 장치 전압 전체)
+
+    Returns:
+        파레토 최적 구성 목록 (비용 오름차순)
+
+    Raises:
+        ValueError: max_utilization이 0 이하이거나 1보다 큰 경우
+    """
+    if not 0.0 < max_utilization <= 1.0:
+        raise ValueError(f"max_utilization은 0보다 크고 1 이하여야 합니다: {max_utilization}")
+
+    current = calculate_total_current(components)
+    supply_index = _build_supply_index(supplies)
+    if input_voltages is None:
+        input_voltages = sorted(supply_index)
+
+    priced_batteries = sorted(
+        ((p, b) for b in batteries if (p := parse_price(b.price_range)) is not None),
+        key=lambda e: e[0],
+    )
+    battery_voltages = sorted({b.voltage for _, b in priced_batteries})
+
+    # 전압 구간 -> 배터리 후보, (전압 구간, 종류, 효율) -> 배터리 파레토 목록
+    # LDO의 배터리 전류는 배터리와 무관하게 출력 전류와 같으므로 효율은 키에서 제외
+    candidate_cache: dict[tuple, list[tuple[float, Battery]]] = {}
+    front_cache: dict[tuple, list[tuple[float, float, Battery]]] = {}
+
+    candidates = []
+    for reg in regulators:
+        reg_price = parse_price(reg.price_range)
+        if reg_price is None or current > reg.max_current_ma:
+            continue
+
+        # 1) 발열, 입력 전압 범위, 전원 사용률을 먼저 확인
+        feasible_inputs = []
+        for vin in input_voltages:
+            index = supply_index.get(vin)
+            if index is None or not regulator_accepts(reg, vin, vout, current):
+                continue
+            heat = regulator_heat_w(reg, vin, vout, current)
+            if heat > max_heat_w:
+                continue
+
+            # 사용률 상한을 만족하려면 정격 전류가 (여유 포함 입력 전류 / 상한) 이상이어야 함
+            input_current = regulator_input_current(reg, vin, vout, current)
+            required = apply_safety_margin(input_current)
+            found = index.cheapest_at_least(required / max_utilization)
+            if found is not None:
+                feasible_inputs.append((vin, heat, required, found))
+        if not feasible_inputs:
+            continue
+
+        # 2) 이 레귤레이터가 받는 배터리 전압 구간의 파레토 목록 (구간별로 공유)
+        lo = bisect_left(battery_voltages, vout + reg.dropout_v)
+        hi = bisect_right(battery_voltages, reg.max_vin)
+        if lo >= hi:
+            continue
+        buck = reg.kind == "buck"
+        front_key = (lo, hi, reg.kind, reg.efficiency if buck else None)
+        battery_front = front_cache.get(front_key)
+        if battery_front is None:
+            candidate_key = (lo, hi, buck)
+            if candidate_key not in candidate_cache:
+                candidate_cache[candidate_key] = _battery_candidates(
+                    priced_batteries, battery_voltages[lo], battery_voltages[hi - 1], buck
+                )
+            battery_front = _battery_front(
+                reg, candidate_cache[candidate_key], vout, current, duty_cycle, min_lifetime_hours
+            )
+            front_cache[front_key] = battery_front
+        if not battery_front:
+            continue
+
+        for vin, heat, required, (supply_price, supply) in feasible_inputs:
+            for bat_price, life, bat in battery_front:
+                candidates.append({
+                    "supply": supply,
+                    "battery": bat,
+                    "regulator": reg,
+                    "vin": vin,
+                    "cost_won": supply_price + bat_price + reg_price,
+                    "lifetime_hours": life,
+                    "heat_w": round(heat, 3),
+                    "utilization": required / supply.max_current_ma,
+                })
+
+    return _pareto_filter(candidates)
+
+
+# =============================================================================
+# 보고서 출력
+# =============================================================================
+
+def print_design_report(
+    components: Sequence[Component],
+    min_lifetime_hours: float = 0.0,
+    max_heat_w: float = 1.0,
+    max_utilization: float = 0.8,
+    vout: float = 3.3,
+    duty_cycle: float = 1.0,
+    project_name: str = "ESP32 프로젝트",
+) -> None:
+    """
+    전원 구성 탐색 결과(파레토 최적 구성)를 출력합니다.
+
+    Args:
+        components: 부품 목록
+        min_lifetime_hours: 최소 배터리 수명 (시간)
+        max_heat_w: 최대 레귤레이터 발열 (W)
+        max_utilization: 전원 공급 장치 최대 사용률 (0.0~1.0)
+        vout: 레귤레이터 출력 전압 (V)
+        duty_cycle: 듀티 사이클 (0.0~1.0)
+        project_name: 프로젝트 이름
+    """
+    designs = search_power_designs(
+        components, min_lifetime_hours, max_heat_w, max_utilization, vout, duty_cycle
+    )
+
+    print()
+    print_separator("=")
+    print(f"  전원 구성 탐색: {project_name}")
+    print_separator("=")
+    print(f"  총 전류: {calculate_total_current(components):.1f} mA (듀티 {duty_cycle * 100:.0f}%)")
+    print(f"  제약: 배터리 수명 >= {min_lifetime_hours:.1f}시간, 발열 <= {max_heat_w:.2f}W, "
+          f"전원 사용률 <= {max_utilization * 100:.0f}%")
+    print()
+
+    if not designs:
+        print("  [!] 조건을 만족하는 구성이 없습니다. 제약 조건을 완화하거나 부하를 줄이세요.")
+        print()
+        return
+
+    print("[ 파레토 최적 구성 (비용 순) ]")
+    print_separator("-")
+    for i, d in enumerate(designs, 1):
+        print(f"  {i}. 약 {d['cost_won']:,.0f}원  |  수명 {d['lifetime_hours']:.1f}시간  |  "
+              f"발열 {d['heat_w']:.3f}W  |  사용률 {d['utilization'] * 100:.0f}%")
+        print(f"     전원: {d['supply'].name} ({d['vin']:.0f}V)  "
+              f"레귤레이터: {d['regulator'].name}  배터리: {d['battery'].name}")
+    print()
+    print("  * 파레토 최적: 다른 구성보다 비용, 수명, 발열 중 어느 하나도 나쁘지 않은 구성")
+    print("  * 배터리 전압이 '출력 전압 + 레귤레이터 드롭아웃'보다 낮으면 제외됩니다.")
+    print()
+
+
+def run_design_example() -> None:
+    """예제 프로젝트(실내 환경 모니터링 시스템)로 전원 구성을 탐색합니다."""
+    print_design_report(
+        build_example_components(),
+        min_lifetime_hours=4.0,
+        max_heat_w=0.8,
+        max_utilization=0.8,
+        project_name="실내 환경 모니터링 시스템",
+    )
+
+
+if __name__ == "__main__":
+    run_design_example()
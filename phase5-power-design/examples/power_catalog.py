@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+ESP32 프로젝트 부품/전원/배터리 카탈로그
+========================================
+전력 예산 계산기가 사용하는 ESP32 동작 모드, 센서/모듈, 배터리,
+전원 공급 장치 목록입니다.
+
+power_budget_calculator에서 `from power_budget_calculator import ESP32_MODES`
+처럼 이름으로 처음 접근할 때 불러오므로, 카탈로그가 필요 없는 실행은
+이 목록을 만드는 비용을 치르지 않습니다.
+"""
+
+from power_budget_calculator import Battery, Component, PowerSupply
+
+
+# =============================================================================
+# 사전 정의된 부품 라이브러리 (카탈로그)
+# =============================================================================
+
+# ESP32 동작 모드별 전류 소비 사전
+# 출처: ESP32 데이터시트 (Espressif Systems)
+ESP32_MODES = {
+    "active_wifi": Component(
+        name="ESP32",
+        voltage=3.3,
+        current_ma=240.0,
+        mode="Active WiFi",
+        note="WiFi 송수신 시 평균 소비 전류",
+    ),
+    "active_bt": Component(
+        name="ESP32",
+        voltage=3.3,
+        current_ma=130.0,
+        mode="Active Bluetooth",
+        note="블루투스 송수신 시 평균 소비 전류",
+    ),
+    "light_sleep": Component(
+        name="ESP32",
+        voltage=3.3,
+        current_ma=0.8,
+        mode="Light Sleep",
+        note="라이트 슬립 모드 (RTC 메모리 유지)",
+    ),
+    "deep_sleep": Component(
+        name="ESP32",
+        voltage=3.3,
+        current_ma=0.01,
+        mode="Deep Sleep",
+        note="딥 슬립 모드 (RTC만 동작, 최소 소비)",
+    ),
+    "active_cpu": Component(
+        name="ESP32",
+        voltage=3.3,
+        current_ma=50.0,
+        mode="Active (No Radio)",
+        note="무선 미사용, CPU 240MHz 동작 시 평균 소비 전류",
+    ),
+}
+
+# 센서 및 모듈 카탈로그
+COMPONENT_CATALOG = {
+    "sht30": Component(
+        name="SHT30 온습도 센서",
+        voltage=3.3,
+        current_ma=0.6,
+        note="I2C 통신, 측정 시 최대 1.5mA (평균 0.6mA)",
+    ),
+    "bmp280": Component(
+        name="BMP280 기압/온도 센서",
+        voltage=3.3,
+        current_ma=0.3,
+        note="I2C 통신, 강제 모드에서 매우 저전력",
+    ),
+    "oled_ssd1306": Component(
+        name="OLED SSD1306 디스플레이",
+        voltage=3.3,
+        current_ma=20.0,
+        note="128x64 해상도, 실제 소비는 표시 내용에 따라 변동",
+    ),
+    "mq2": Component(
+        name="MQ-2 가스 센서",
+        voltage=5.0,
+        current_ma=150.0,
+        note="히터 포함, 예열 시간 필요 (약 20초), 5V 전원 필요",
+    ),
+    "relay": Component(
+        name="릴레이 모듈",
+        voltage=5.0,
+        current_ma=70.0,
+        note="코일 동작 시 전류, 대기 시 약 5mA",
+    ),
+    "led": Component(
+        name="LED",
+        voltage=3.3,
+        current_ma=20.0,
+        note="표준 LED (적색 기준), 저항 포함",
+    ),
+    "ds18b20": Component(
+        name="DS18B20 온도 센서",
+        voltage=3.3,
+        current_ma=1.5,
+        note="1-Wire 통신, 변환 시 최대 1.5mA",
+    ),
+}
+
+# 일반적인 배터리 종류
+COMMON_BATTERIES = [
+    Battery("18650 리튬이온", 3000.0, 3.7, "충전 가능, ESP32 프로젝트에 가장 적합", "li-ion", "5,000~8,000원"),
+    Battery("AA 알카라인 (x2 직렬)", 2500.0, 3.0, "2개 직렬 = 3V, 레귤레이터 필요할 수 있음", "alkaline", "1,000~2,000원"),
+    Battery("LiPo 1000mAh", 1000.0, 3.7, "소형 웨어러블/IoT 프로젝트용", "lipo", "5,000~7,000원"),
+    Battery("LiPo 2000mAh", 2000.0, 3.7, "중형 IoT 프로젝트용", "lipo", "7,000~10,000원"),
+    Battery("CR2032 코인셀", 220.0, 3.0, "딥 슬립 위주 초저전력 프로젝트만 적합", "lithium-primary", "500~1,000원"),
+]
+
+# 전원 공급 장치 목록
+POWER_SUPPLIES = [
+    PowerSupply("USB 충전기 (소형)", 5.0, 500, "3,000~5,000원"),
+    PowerSupply("USB 충전기 (일반)", 5.0, 1000, "5,000~8,000원"),
+    PowerSupply("USB 충전기 (고출력)", 5.0, 2000, "8,000~15,000원"),
+    PowerSupply("5V 2A 어댑터", 5.0, 2000, "5,000~10,000원"),
+    PowerSupply("5V 3A 어댑터", 5.0, 3000, "8,000~15,000원"),
+    PowerSupply("12V 1A 어댑터", 12.0, 1000, "5,000~10,000원"),
+    PowerSupply("12V 2A 어댑터", 12.0, 2000, "8,000~15,000원"),
+]
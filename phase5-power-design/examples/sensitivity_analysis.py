@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+전력 예산 민감도 분석
+=====================
+어떤 부품의 전류가 배터리 수명이나 레귤레이터 발열에 가장 큰 영향을
+주는지 알아봅니다. 입력을 하나씩 바꿔 가며 다시 계산하는 대신,
+계산식을 직접 미분한 편미분값과 탄력도를 부품 목록 한 번 순회로 구합니다.
+
+계산식과 편미분:
+  총 전류    I = Σ c_i x q_i               (c: 부품 전류, q: 수량)
+  배터리 수명 H = U / (I x d)               (U: 사용 가능 용량, d: 듀티 사이클)
+  발열       P = (Vin - Vout) x I / 1000
+
+  ∂I/∂c_i = q_i          ∂I/∂q_i = c_i
+  ∂H/∂c_i = -H x q_i / I  ∂H/∂용량 = H / 용량
+  ∂P/∂c_i = (Vin - Vout) x q_i / 1000      ∂P/∂Vin = I / 1000
+
+  탄력도 E = (x / y) x ∂y/∂x : 입력 x가 1% 변할 때 출력 y가 변하는 비율(%)
+  부품 전류의 탄력도는 그 부품이 총 전류에서 차지하는 비율과 같습니다.
+
+사용법:
+  python power_budget_calculator.py --sensitivity
+  python sensitivity_analysis.py
+"""
+
+from typing import Sequence
+
+from power_budget_calculator import (
+    Battery,
+    Component,
+    COMMON_BATTERIES,
+    build_example_components,
+    calculate_battery_life,
+    calculate_heat_dissipation,
+    print_separator,
+)
+
+
+# =============================================================================
+# 민감도 계산
+# =============================================================================
+
+def _row(
+    label: str,
+    value: float,
+    d_current: float,
+    d_life_hours: float,
+    d_heat_w: float,
+    totals: dict,
+) -> dict:
+    """편미분값으로부터 탄력도를 계산하여 표의 한 행을 만듭니다."""
+    def elasticity(derivative: float, output: float) -> float:
+        return derivative * value / output if output else 0.0
+
+    return {
+        "input": label,
+        "value": value,
+        "d_current_ma": d_current,
+        "d_life_hours": d_life_hours,
+        "d_heat_w": d_heat_w,
+        "e_current": elasticity(d_current, totals["current_ma"]),
+        "e_life": elasticity(d_life_hours, totals["life_hours"]),
+        "e_heat": elasticity(d_heat_w, totals["heat_w"]),
+    }
+
+
+def calculate_sensitivity(
+    components: Sequence[Component],
+    battery: Battery,
+    vin: float = 5.0,
+    vout: float = 3.3,
+    duty_cycle: float = 1.0,
+) -> dict:
+    """
+    총 전류, 배터리 수명, 레귤레이터 발열의 입력별 편미분과 탄력도를 계산합니다.
+
+    모든 부품의 전류(current_ma)와 수량(quantity), 입력 전압(vin),
+    배터리 용량, 듀티 사이클에 대한 값을 구하며, 부품 수에 비례하는
+    시간만 걸립니다. 수량은 연속 변수로 취급합니다.
+
+    Args:
+        components: 부품 목록
+        battery: 배터리 정보
+        vin: 레귤레이터 입력 전압 (V)
+        vout: 레귤레이터 출력 전압 (V)
+        duty_cycle: 듀티 사이클 (0.0~1.0)
+
+    Returns:
+        {"totals": 기준 출력값, "rows": 탄력도 크기 순으로 정렬된 입력별 결과}
+    """
+    # 부품 목록 한 번 순회: 총 전류 합산
+    total_current = 0.0
+    for c in components:
+        total_current += c.current_ma * c.quantity
+
+    life = calculate_battery_life(total_current, battery, duty_cycle)
+    usable = life.get("usable_capacity_mah", 0.0)
+    effective = total_current * duty_cycle
+    life_hours = usable / effective if effective > 0 else float("inf")
+    drop = vin - vout
+
+    totals = {
+        "current_ma": total_current,
+        "life_hours": life_hours,
+        "heat_w": drop * total_current / 1000.0,
+        "battery_name": battery.name,
+        "vin": vin,
+        "vout": vout,
+        "duty_cycle": duty_cycle,
+    }
+
+    # ∂H/∂I = -H / I (수명은 총 전류에 반비례)
+    dh_di = -life_hours / total_current if total_current > 0 and effective > 0 else 0.0
+    dp_di = drop / 1000.0
+
+    rows = []
+    for c in components:
+        label = f"{c.name}" + (f" ({c.mode})" if c.mode else "")
+        rows.append(_row(
+            f"{label} 전류", c.current_ma,
+            c.quantity, dh_di * c.quantity, dp_di * c.quantity, totals,
+        ))
+        rows.append(_row(
+            f"{label} 수량", c.quantity,
+            c.current_ma, dh_di * c.current_ma, dp_di * c.current_ma, totals,
+        ))
+
+    capacity = battery.capacity_mah
+    rows.append(_row(
+        "배터리 용량", capacity,
+        0.0, life_hours / capacity if capacity and effective > 0 else 0.0, 0.0, totals,
+    ))
+    rows.append(_row(
+        "듀티 사이클", duty_cycle,
+        0.0, -life_hours / duty_cycle if duty_cycle and effective > 0 else 0.0, 0.0, totals,
+    ))
+    rows.append(_row(
+        "입력 전압 Vin", vin,
+        0.0, 0.0, total_current / 1000.0, totals,
+    ))
+
+    rows.sort(key=lambda r: (abs(r["e_life"]), abs(r["e_heat"])), reverse=True)
+    return {"totals": totals, "rows": rows}
+
+
+# =============================================================================
+# 보고서 출력
+# =============================================================================
+
+def print_sensitivity_report(
+    components: Sequence[Component],
+    battery: Battery = COMMON_BATTERIES[0],
+    vin: float = 5.0,
+    vout: float = 3.3,
+    duty_cycle: float = 1.0,
+    project_name: str = "ESP32 프로젝트",
+) -> None:
+    """
+    입력별 민감도를 영향이 큰 순서로 출력합니다.
+
+    Args:
+        components: 부품 목록
+        battery: 배터리 정보
+        vin: 레귤레이터 입력 전압 (V)
+        vout: 레귤레이터 출력 전압 (V)
+        duty_cycle: 듀티 사이클 (0.0~1.0)
+        project_name: 프로젝트 이름
+    """
+    result = calculate_sensitivity(components, battery, vin, vout, duty_cycle)
+    totals = result["totals"]
+    heat = calculate_heat_dissipation(vin, vout, totals["current_ma"])
+
+    print()
+    print_separator("=")
+    print(f"  민감도 분석: {project_name}")
+    print_separator("=")
+    print(f"  총 전류:     {totals['current_ma']:.2f} mA")
+    print(f"  배터리 수명: {totals['life_hours']:.1f} 시간 ({totals['battery_name']}, 듀티 {duty_cycle * 100:.0f}%)")
+    print(f"  발열:        {totals['heat_w']:.3f} W ({vin:.1f}V -> {vout:.1f}V) [{heat['warning_level']}]")
+    print()
+    print("[ 입력별 영향 (배터리 수명 탄력도 크기 순) ]")
+    print_separator("-")
+    print(
+        f"  {'입력':<34} {'값':>8} {'∂전류(mA)':>10} {'∂수명(h)':>10} {'∂발열(mW)':>10} "
+        f"{'E_전류':>7} {'E_수명':>7} {'E_발열':>7}"
+    )
+    print(f"  {'-'*34} {'-'*8} {'-'*10} {'-'*10} {'-'*10} {'-'*7} {'-'*7} {'-'*7}")
+    for r in result["rows"]:
+        print(
+            f"  {r['input']:<34} {r['value']:>8.2f} {r['d_current_ma']:>10.3f} {r['d_life_hours']:>10.3f} "
+            f"{r['d_heat_w'] * 1000:>10.3f} {r['e_current']:>7.3f} {r['e_life']:>7.3f} {r['e_heat']:>7.3f}"
+        )
+    print()
+    print("  * ∂: 입력이 1 단위(mA, 개, mAh, V) 늘 때 출력의 변화량")
+    print("  * E(탄력도): 입력이 1% 늘 때 출력이 변하는 비율(%)")
+    print("  * 부품 전류의 수명 탄력도 -0.5는 그 부품 전류를 10% 줄이면 수명이 약 5% 는다는 뜻입니다.")
+    print()
+
+
+if __name__ == "__main__":
+    print_sensitivity_report(
+        build_example_components(),
+        project_name="실내 환경 모니터링 시스템",
+    )
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+Arduino 스케치 BOM 자동 추출기
+==============================
+.ino 소스 코드를 분석하여 사용된 라이브러리와 주변장치를 찾아내고,
+전력 예산 계산기의 부품 카탈로그(COMPONENT_CATALOG, ESP32_MODES)로
+매핑한 부품 목록(BOM)과 예상 듀티 사이클을 만듭니다.
+
+주요 기능:
+  - 라이브러리/식별자 기반 부품 감지 (SHT30, BMP280, SSD1306, MQ-2, DS18B20 등)
+  - 핀 정의로 릴레이/LED 수량 추정
+  - WiFi/Bluetooth 사용 여부로 ESP32 동작 모드 결정
+  - esp_deep_sleep / 타이머 웨이크업과 delay()로 듀티 사이클 추정
+  - 파일 내용 해시 기반 캐시 (사용자 캐시 폴더에 저장, 변경된 파일만 다시 분석)
+  - 많은 스케치를 프로세스 풀로 병렬 분석
+
+사용법:
+  python power_budget_calculator.py --scan [폴더 또는 .ino ...]
+  python sketch_bom_analyzer.py [폴더 또는 .ino ...]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+import ast
+import contextlib
+import hashlib
+import json
+import operator
+import os
+import re
+import sys
+
+from power_budget_calculator import (
+    Component,
+    COMPONENT_CATALOG,
+    ESP32_MODES,
+    calculate_total_current,
+    print_separator,
+)
+
+
+# =============================================================================
+# 감지 규칙
+# =============================================================================
+
+# 분석 규칙이나 캐시 형식이 바뀌면 올려서 이전 캐시를 무효화합니다
+# (캐시에는 카탈로그 키와 수량만 저장하므로 카탈로그 수정은 올릴 필요 없음)
+ANALYZER_VERSION = 2
+
+# 기본 캐시 파일 이름 (사용자 캐시 폴더 기준, default_cache_path() 참고)
+CACHE_DIRNAME = "esp32-power-budget"
+CACHE_FILENAME = "sketch_bom_cache.json"
+
+# 이 개수 이상의 파일을 새로 분석해야 할 때만 프로세스 풀을 사용
+# (프로세스 시작 비용이 분석 비용보다 커지는 것을 방지)
+PARALLEL_THRESHOLD = 8
+
+# 카탈로그 키 -> 감지 정규식 (주석/문자열을 제거한 코드에 적용)
+PERIPHERAL_PATTERNS = {
+    "sht30": re.compile(r"Adafruit_SHT3\d|\bSHT3\d", re.IGNORECASE),
+    "bmp280": re.compile(r"Adafruit_BMP280|\bBMP280", re.IGNORECASE),
+    "oled_ssd1306": re.compile(r"Adafruit_SSD1306|SSD1306", re.IGNORECASE),
+    "mq2": re.compile(r"MQ_?2(?!\d)", re.IGNORECASE),
+    "ds18b20": re.compile(r"DallasTemperature|DS18B20", re.IGNORECASE),
+}
+
+# 수량을 핀 정의 개수로 추정하는 부품 (카탈로그 키 -> 핀 이름 정규식)
+PIN_COUNTED_PATTERNS = {
+    "relay": re.compile(r"RELAY", re.IGNORECASE),
+    "led": re.compile(r"LED", re.IGNORECASE),
+}
+
+WIFI_PATTERN = re.compile(r"#include\s*<WiFi\w*\.h>|\bWiFi\.(?:begin|softAP)\b")
+BT_PATTERN = re.compile(r"BluetoothSerial|BLEDevice|\besp_bt_\w+")
+DEEP_SLEEP_PATTERN = re.compile(r"\besp_deep_sleep(?:_start)?\s*\(")
+LIGHT_SLEEP_PATTERN = re.compile(r"\besp_light_sleep_start\s*\(")
+TIMER_WAKEUP_PATTERN = re.compile(r"\besp_sleep_enable_timer_wakeup\s*\(([^;]+)\)\s*;")
+DEEP_SLEEP_ARG_PATTERN = re.compile(r"\besp_deep_sleep\s*\(([^;]+)\)\s*;")
+DELAY_PATTERN = re.compile(r"\bdelay\s*\(\s*([^()]+?)\s*\)\s*;")
+
+# 주석과 문자열 리터럴 (문자열 안의 // 를 주석으로 오인하지 않도록 함께 매칭)
+_COMMENT_OR_STRING = re.compile(
+    r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'',
+    re.DOTALL,
+)
+
+# 상수 정의: #define NAME 값 / const 타입 NAME = 값; / const 타입 NAME[] = {...};
+_DEFINE = re.compile(r"^[ \t]*#define[ \t]+(\w+)[ \t]+([^\n]+)$", re.MULTILINE)
+_CONST = re.compile(
+    r"\bconst\s+(?:unsigned\s+)?(?:long\s+long|long|int|uint\d+_t|int\d+_t|float|double)\s+"
+    r"(\w+)\s*(\[\s*\d*\s*\])?\s*=\s*(\{[^}]*\}|[^;]+);"
+)
+_INT_SUFFIX = re.compile(r"(?<=[0-9])[uUlL]+\b")
+
+# WiFi 연결에 걸리는 대략적인 시간 (밀리초) - 깨어날 때마다 재연결한다고 가정
+WIFI_CONNECT_MS = 3000.0
+# delay()가 없을 때의 최소 활성 시간 (밀리초)
+MIN_ACTIVE_MS = 100.0
+
+
+@dataclass
+class SketchAnalysis:
+    """
+    스케치 한 개의 분석 결과.
+
+    Attributes:
+        path: 스케치 파일 경로
+        content_hash: 파일 내용의 SHA-256 해시 (캐시 키)
+        components: 활성 구간에 전원이 공급되는 부품 목록
+        sleep_component: 슬립 구간의 ESP32 (슬립을 사용하지 않으면 None)
+        duty_cycle: 활성 구간의 비율 (0.0~1.0)
+        findings: 감지 근거 메모
+    """
+    path: str
+    content_hash: str
+    components: list[Component] = field(default_factory=list)
+    sleep_component: Optional[Component] = None
+    duty_cycle: float = 1.0
+    findings: list[str] = field(default_factory=list)
+
+    @property
+    def active_current_ma(self) -> float:
+        """활성 구간의 총 전류 소비 (mA)"""
+        return calculate_total_current(self.components)
+
+    @property
+    def average_current_ma(self) -> float:
+        """듀티 사이클을 반영한 평균 전류 소비 (mA)"""
+        sleep_ma = self.sleep_component.total_current_ma if self.sleep_component else 0.0
+        return self.active_current_ma * self.duty_cycle + sleep_ma * (1.0 - self.duty_cycle)
+
+
+# =============================================================================
+# 소스 분석
+# =============================================================================
+
+def strip_comments_and_strings(source: str) -> str:
+    """
+    주석을 제거하고 문자열 리터럴은 빈 문자열로 바꿉니다.
+
+    주석 속 설명이나 Serial.println() 메시지의 부품 이름이
+    실제 사용으로 감지되는 것을 막기 위한 전처리입니다.
+    """
+    def _sub(m: re.Match) -> str:
+        text = m.group(0)
+        if text.startswith("/"):
+            # 줄 번호가 바뀌지 않도록 줄바꿈은 남김
+            return "\n" * text.count("\n")
+        return text[0] * 2
+
+    return _COMMENT_OR_STRING.sub(_sub, source)
+
+
+def _collect_constants(code: str) -> tuple[dict[str, str], dict[str, int]]:
+    """
+    #define과 const 정의를 모읍니다.
+
+    Returns:
+        (이름 -> 값 표현식, 배열 이름 -> 원소 개수)
+    """
+    values: dict[str, str] = {}
+    array_sizes: dict[str, int] = {}
+    for name, value in _DEFINE.findall(code):
+        values[name] = value.strip()
+    for name, is_array, value in _CONST.findall(code):
+        if is_array:
+            items = [v for v in value.strip("{} \n").split(",") if v.strip()]
+            array_sizes[name] = len(items)
+        else:
+            values[name] = value.strip()
+    return values, array_sizes
+
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+}
+
+
+def evaluate_expression(expr: str, constants: dict[str, str], _depth: int = 0) -> Optional[float]:
+    """
+    C 상수 표현식(숫자, 사칙연산, 정의된 상수)을 계산합니다.
+
+    `TIME_TO_SLEEP * uS_TO_S_FACTOR`처럼 상수를 조합한 인수를 풀기 위해 사용하며,
+    계산할 수 없는 표현식(함수 호출, 변수 등)이면 None을 반환합니다.
+    """
+    if _depth > 8:
+        return None
+    text = _INT_SUFFIX.sub("", expr.strip())
+    text = re.sub(r"\(\s*(?:unsigned\s+)?(?:long\s+long|long|int|uint\d+_t|float|double)\s*\)", "", text)
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError:
+        return None
+
+    def _eval(node: ast.AST) -> Optional[float]:
+        if isinstance(node, ast.Expression):
+            return _eval(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return float(node.value)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            inner = _eval(node.operand)
+            return None if inner is None else -inner
+        if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+            left, right = _eval(node.left), _eval(node.right)
+            if left is None or right is None or (right == 0 and isinstance(node.op, (ast.Div, ast.FloorDiv))):
+                return None
+            return _BIN_OPS[type(node.op)](left, right)
+        if isinstance(node, ast.Name) and node.id in constants:
+            return evaluate_expression(constants[node.id], constants, _depth + 1)
+        return None
+
+    return _eval(tree)
+
+
+# ESP32 동작 모드 키 -> 감지 근거 (분석 결과의 findings 첫 줄)
+_ESP32_REASONS = {
+    "active_wifi": "WiFi 사용",
+    "active_bt": "Bluetooth 사용",
+    "active_cpu": "무선 미사용",
+}
+
+
+def parse_sketch_source(source: str) -> dict:
+    """
+    스케치 소스에서 카탈로그 값과 무관한 감지 결과만 추출합니다.
+
+    부품의 전류, 전압, 이름은 담지 않고 카탈로그 키와 수량만 담으므로,
+    이 결과를 캐시에 저장해도 카탈로그를 고치면 다음 스캔에 바로 반영됩니다.
+
+    Args:
+        source: .ino 파일 내용
+
+    Returns:
+        {"esp32": ESP32 모드 키,
+         "parts": [[카탈로그 키, 수량, 감지 근거, 핀 정의로 셌는지 여부], ...],
+         "sleep": 슬립 모드 키 ('deep_sleep', 'light_sleep') 또는 None,
+         "sleep_us": 슬립 시간 (us, 알 수 없으면 None),
+         "active_ms": 깨어 있는 시간 (ms, 슬립을 사용하지 않으면 None)}
+    """
+    code = strip_comments_and_strings(source)
+    constants, array_sizes = _collect_constants(code)
+
+    # ----- ESP32 동작 모드 -----
+    uses_wifi = bool(WIFI_PATTERN.search(code))
+    if uses_wifi:
+        esp_key = "active_wifi"
+    elif BT_PATTERN.search(code):
+        esp_key = "active_bt"
+    else:
+        esp_key = "active_cpu"
+    parsed = {"esp32": esp_key, "parts": [], "sleep": None, "sleep_us": None, "active_ms": None}
+
+    # ----- 라이브러리/식별자 기반 주변장치 -----
+    for key, pattern in PERIPHERAL_PATTERNS.items():
+        m = pattern.search(code)
+        if m:
+            parsed["parts"].append([key, 1, m.group(0), False])
+
+    # ----- 핀 정의 개수로 수량을 세는 부품 -----
+    for key, pattern in PIN_COUNTED_PATTERNS.items():
+        names = [n for n in constants if "PIN" in n.upper() and pattern.search(n)]
+        arrays = [n for n in array_sizes if "PIN" in n.upper() and pattern.search(n)]
+        quantity = len(names) + sum(array_sizes[n] for n in arrays)
+        if quantity:
+            parsed["parts"].append([key, quantity, ", ".join(names + arrays), True])
+
+    # ----- 슬립 시간과 활성 시간 -----
+    if DEEP_SLEEP_PATTERN.search(code):
+        parsed["sleep"] = "deep_sleep"
+    elif LIGHT_SLEEP_PATTERN.search(code):
+        parsed["sleep"] = "light_sleep"
+
+    if parsed["sleep"] is not None:
+        m = TIMER_WAKEUP_PATTERN.search(code) or DEEP_SLEEP_ARG_PATTERN.search(code)
+        if m:
+            parsed["sleep_us"] = evaluate_expression(m.group(1), constants)
+
+        active_ms = 0.0
+        for arg in DELAY_PATTERN.findall(code):
+            value = evaluate_expression(arg, constants)
+            if value is not None:
+                active_ms += value
+        if uses_wifi:
+            active_ms += WIFI_CONNECT_MS
+        parsed["active_ms"] = max(active_ms, MIN_ACTIVE_MS)
+
+    return parsed
+
+
+def build_analysis(parsed: dict, path: str = "", content_hash: str = "") -> SketchAnalysis:
+    """
+    parse_sketch_source()의 감지 결과에 현재 카탈로그 값을 채워 분석 결과를 만듭니다.
+
+    듀티 사이클 추정 방법:
+      - 딥/라이트 슬립을 사용하지 않으면 항상 활성 (1.0)
+      - 슬립을 사용하면 타이머 웨이크업 시간을 슬립 시간으로,
+        delay() 합계(+ WiFi 재연결 시간)를 활성 시간으로 보고
+        활성 / (활성 + 슬립)으로 계산
+
+    Args:
+        parsed: parse_sketch_source()의 반환값 (캐시에 저장된 값)
+        path: 보고서에 표시할 파일 경로
+        content_hash: 파일 내용 해시
+
+    Returns:
+        분석 결과
+    """
+    result = SketchAnalysis(path=path, content_hash=content_hash)
+
+    esp = ESP32_MODES[parsed["esp32"]]
+    result.components.append(esp.replace())
+    result.findings.append(f"{_ESP32_REASONS[parsed['esp32']]} -> {esp.name} {esp.mode}")
+
+    for key, quantity, evidence, by_pins in parsed["parts"]:
+        part = COMPONENT_CATALOG[key]
+        if by_pins:
+            result.components.append(part.replace(quantity=quantity, note=f"핀 정의: {evidence}"))
+            result.findings.append(f"{evidence} -> {part.name} x{quantity}")
+        else:
+            result.components.append(part.replace(quantity=quantity, note=f"감지: {evidence}"))
+            result.findings.append(f"{evidence} -> {part.name}")
+
+    if parsed["sleep"] is not None:
+        result.sleep_component = ESP32_MODES[parsed["sleep"]].replace()
+        sleep_us, active_ms = parsed["sleep_us"], parsed["active_ms"]
+        if sleep_us:
+            sleep_ms = sleep_us / 1000.0
+            result.duty_cycle = active_ms / (active_ms + sleep_ms)
+            result.findings.append(
+                f"{result.sleep_component.mode} {sleep_ms / 1000:.0f}s / 활성 약 {active_ms / 1000:.1f}s"
+            )
+        else:
+            result.duty_cycle = 0.01
+            result.findings.append(
+                f"{result.sleep_component.mode} 사용, 슬립 시간을 알 수 없어 듀티 1%로 가정"
+            )
+
+    return result
+
+
+def analyze_sketch_source(source: str, path: str = "", content_hash: str = "") -> SketchAnalysis:
+    """
+    스케치 소스 코드 한 개를 분석합니다.
+
+    Args:
+        source: .ino 파일 내용
+        path: 보고서에 표시할 파일 경로
+        content_hash: 파일 내용 해시
+
+    Returns:
+        분석 결과 (build_analysis() 참고)
+    """
+    return build_analysis(parse_sketch_source(source), path, content_hash)
+
+
+# =============================================================================
+# 캐시와 병렬 스캔
+# =============================================================================
+
+def find_sketches(paths: Sequence[str]) -> list[Path]:
+    """폴더는 하위까지 .ino 파일을 찾고, 파일은 그대로 사용합니다."""
+    found: list[Path] = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            found.extend(sorted(p.rglob("*.ino")))
+        elif p.suffix == ".ino":
+            found.append(p)
+    return found
+
+
+def default_cache_path() -> str:
+    """
+    사용자 캐시 폴더 안의 기본 캐시 파일 경로를 반환합니다.
+
+    스캔하는 소스 폴더에는 파일을 만들지 않습니다. 캐시 키가 파일 내용의
+    해시이므로 여러 폴더를 스캔해도 캐시 파일 하나를 함께 사용합니다.
+      - Windows: %LOCALAPPDATA%
+      - 그 외:   $XDG_CACHE_HOME 또는 ~/.cache
+    """
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        base = os.environ["LOCALAPPDATA"]
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, CACHE_DIRNAME, CACHE_FILENAME)
+
+
+def load_cache(cache_path: Optional[str]) -> dict:
+    """캐시 파일을 읽습니다. 없거나 버전이 다르면 빈 캐시를 반환합니다."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != ANALYZER_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_cache(cache_path: Optional[str], entries: dict) -> bool:
+    """
+    캐시 파일을 저장합니다. 임시 파일에 쓴 뒤 교체하여 중간 상태를 남기지 않습니다.
+
+    쓰기 권한이 없는 등 저장에 실패해도 분석 결과는 그대로 사용할 수 있으므로
+    예외를 일으키지 않고 False를 반환합니다.
+
+    Returns:
+        저장 성공 여부
+    """
+    if not cache_path:
+        return False
+    tmp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": ANALYZER_VERSION, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def scan_sketches(
+    paths: Sequence[str],
+    cache_path: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> list[SketchAnalysis]:
+    """
+    여러 스케치를 분석합니다. 내용이 바뀐 파일만 다시 분석합니다.
+
+    캐시 키는 파일 경로가 아니라 내용의 SHA-256 해시이므로, 파일을
+    옮기거나 같은 스케치를 복사해도 다시 분석하지 않습니다. 캐시에는
+    parse_sketch_source()의 감지 결과만 저장하고 부품 값은 매번 현재
+    카탈로그에서 채웁니다.
+    새로 분석할 파일이 많으면 프로세스 풀로 병렬 처리합니다.
+
+    Args:
+        paths: 스캔할 폴더 또는 .ino 파일 목록
+        cache_path: 캐시 파일 경로 (None이면 캐시 사용 안 함)
+        workers: 병렬 작업 프로세스 수 (None = CPU 수, 1 = 순차 처리)
+
+    Returns:
+        파일별 분석 결과 목록 (입력 순서)
+    """
+    sketches = find_sketches(paths)
+    cache = load_cache(cache_path)
+
+    hashes: list[str] = []
+    pending: dict[str, str] = {}   # 해시 -> 소스 (같은 내용은 한 번만 분석)
+    for sketch in sketches:
+        raw = sketch.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        hashes.append(digest)
+        if digest not in cache and digest not in pending:
+            pending[digest] = raw.decode("utf-8", errors="replace")
+
+    if pending:
+        sources = list(pending.values())
+        if workers != 1 and len(sources) >= PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(parse_sketch_source, sources, chunksize=4))
+        else:
+            parsed = [parse_sketch_source(source) for source in sources]
+        cache.update(zip(pending, parsed))
+        save_cache(cache_path, cache)
+
+    return [build_analysis(cache[h], str(s), h) for s, h in zip(sketches, hashes)]
+
+
+# =============================================================================
+# 보고서 출력
+# =============================================================================
+
+def print_sketch_bom_report(analyses: Sequence[SketchAnalysis]) -> None:
+    """
+    스케치별 추출 BOM과 평균 전류를 출력합니다.
+
+    Args:
+        analyses: scan_sketches()의 분석 결과 목록
+    """
+    print()
+    print_separator("=")
+    print("  스케치 BOM 자동 추출 결과")
+    print_separator("=")
+
+    for a in analyses:
+        print()
+        print(f"[ {a.path} ]")
+        print_separator("-")
+        for c in a.components:
+            mode_str = c.mode if c.mode else "-"
+            print(f"  {c.name:<28} {mode_str:<18} {c.current_ma:>8.2f} mA x{c.quantity}")
+        if a.sleep_component:
+            s = a.sleep_component
+            print(f"  {s.name:<28} {s.mode:<18} {s.current_ma:>8.2f} mA (슬립 구간)")
+        print(f"  활성 전류: {a.active_current_ma:.2f} mA, 듀티 사이클: {a.duty_cycle * 100:.2f}%, "
+              f"평균 전류: {a.average_current_ma:.2f} mA")
+        for note in a.findings:
+            print(f"    - {note}")
+
+    print()
+    print("  * 감지 결과는 코드 패턴에 기반한 추정입니다. 실제 회로와 비교해 확인하세요.")
+    print("  * 추출된 부품 목록은 print_power_report()에 그대로 전달할 수 있습니다.")
+    print()
+
+
+def run_sketch_scan(paths: Sequence[str]) -> None:
+    """
+    스케치를 스캔하고 결과를 출력합니다.
+
+    경로를 주지 않으면 저장소 전체(이 파일 기준 두 단계 위)를 스캔합니다.
+    캐시는 스캔하는 폴더가 아니라 사용자 캐시 폴더(default_cache_path())에
+    저장하며, 저장할 수 없으면 캐시 없이 계속합니다.
+
+    Args:
+        paths: 스캔할 폴더 또는 .ino 파일 목록
+    """
+    if not paths:
+        paths = [str(Path(__file__).resolve().parent.parent.parent)]
+    analyses = scan_sketches(paths, cache_path=default_cache_path())
+    if not analyses:
+        print("\n  [!] .ino 파일을 찾을 수 없습니다.")
+        return
+    print_sketch_bom_report(analyses)
+
+
+if __name__ == "__main__":
+    run_sketch_scan(sys.argv[1:])
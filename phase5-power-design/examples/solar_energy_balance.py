@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+태양광 + 배터리 에너지 수지 시뮬레이터
+======================================
+18650 배터리와 소형 태양광 패널로 동작하는 야외 노드의
+배터리 충전 상태(SoC)를 1년 이상 시간 단위로 시뮬레이션합니다.
+
+주요 기능:
+  - 합성 일사량 모델 (위도, 계절, 흐린 날 반영) 또는 CSV 일사량 데이터
+  - 충전기 효율을 반영한 시간별 발전량 계산
+  - 부품 목록(calculate_total_current) 또는 24시간 부하 프로파일 지원
+  - 배터리 용량에서 포화(clamp)되는 SoC 계산 (누적합 기반)
+  - 방전까지 걸리는 일수, 최소 SoC 보고
+  - 패널/배터리 크기 조합 스윕 (다년간)
+
+사용법:
+  python power_budget_calculator.py --solar              # 합성 일사량으로 예제 실행
+  python power_budget_calculator.py --solar ghi.csv      # CSV 일사량으로 예제 실행
+  python solar_energy_balance.py [ghi.csv]               # 직접 실행
+"""
+
+from dataclasses import dataclass
+from bisect import bisect_right
+from itertools import accumulate, compress, count, islice, repeat
+from operator import add, le, mul, sub
+from typing import Optional, Sequence, Union
+import csv
+import math
+import random
+import sys
+
+from power_budget_calculator import (
+    Battery,
+    COMMON_BATTERIES,
+    COMPONENT_CATALOG,
+    ESP32_MODES,
+    calculate_total_current,
+    print_separator,
+)
+
+
+# =============================================================================
+# 데이터 구조 및 상수
+# =============================================================================
+
+@dataclass
+class SolarPanel:
+    """
+    태양광 패널 정보.
+
+    Attributes:
+        name: 패널 이름
+        peak_power_w: 표준 조건(1000 W/m²)에서의 최대 출력 (W)
+        note: 참고 사항
+    """
+    name: str
+    peak_power_w: float
+    note: str = ""
+
+
+# 소형 IoT 노드에 흔히 쓰이는 태양광 패널
+SOLAR_PANELS = [
+    SolarPanel("5V 0.5W 미니 패널", 0.5, "60x60mm, 실내/그늘에서는 부족"),
+    SolarPanel("5V 1W 패널", 1.0, "110x60mm, 딥 슬립 위주 센서 노드용"),
+    SolarPanel("6V 2W 패널", 2.0, "136x110mm, 주기적 WiFi 전송 노드용"),
+    SolarPanel("6V 3.5W 패널", 3.5, "165x135mm, 상시 동작 장치용"),
+    SolarPanel("6V 6W 패널", 6.0, "220x175mm, 겨울철 여유 확보용"),
+]
+
+# 충전기 효율 (패널 전력 -> 배터리 충전 전력)
+# TP4056 같은 리니어 충전기는 약 70~80%, MPPT 충전기(CN3791 등)는 약 85~90%
+CHARGER_EFFICIENCY = 0.75
+
+# 표준 시험 조건(STC)의 일사량 (W/m²)
+STC_IRRADIANCE = 1000.0
+
+HOURS_PER_DAY = 24
+DAYS_PER_YEAR = 365
+HOURS_PER_YEAR = HOURS_PER_DAY * DAYS_PER_YEAR
+
+# 기본 위도 (서울 약 37.5도)
+DEFAULT_LATITUDE_DEG = 37.5
+
+
+# =============================================================================
+# 일사량 데이터
+# =============================================================================
+
+def synthetic_irradiance(
+    years: int = 1,
+    latitude_deg: float = DEFAULT_LATITUDE_DEG,
+    cloudy_day_ratio: float = 0.4,
+    seed: Optional[int] = 0,
+) -> list[float]:
+    """
+    합성 시간별 수평면 일사량(GHI) 데이터를 생성합니다.
+
+    태양 적위와 시간각으로 태양 고도를 계산하고, 대기 질량에 따른
+    감쇠(Meinel 모델)를 적용한 맑은 날 일사량에 날마다 무작위로
+    흐린 날 계수를 곱합니다. 같은 seed는 항상 같은 결과를 냅니다.
+
+    Args:
+        years: 생성할 기간 (년)
+        latitude_deg: 설치 위치의 위도 (도)
+        cloudy_day_ratio: 흐린 날의 비율 (0.0~1.0)
+        seed: 난수 시드 (None이면 매번 다른 날씨)
+
+    Returns:
+        시간별 일사량 목록 (W/m², 길이 = years x 8760)
+    """
+    rng = random.Random(seed)
+    lat = math.radians(latitude_deg)
+    sin_lat, cos_lat = math.sin(lat), math.cos(lat)
+
+    # 시간각의 코사인은 매일 같으므로 한 번만 계산 (각 시간의 중앙 기준)
+    cos_hour_angles = [
+        math.cos(math.radians(15.0 * (h + 0.5 - 12.0))) for h in range(HOURS_PER_DAY)
+    ]
+
+    irradiance: list[float] = []
+    for day in range(years * DAYS_PER_YEAR):
+        day_of_year = day % DAYS_PER_YEAR + 1
+        decl = math.radians(23.45) * math.sin(2.0 * math.pi * (284 + day_of_year) / 365.0)
+        a = sin_lat * math.sin(decl)
+        b = cos_lat * math.cos(decl)
+
+        # 흐린 날은 맑은 날 일사량의 10~60%만 도달
+        if rng.random() < cloudy_day_ratio:
+            day_factor = rng.uniform(0.1, 0.6)
+        else:
+            day_factor = rng.uniform(0.85, 1.0)
+
+        for cos_w in cos_hour_angles:
+            sin_elev = a + b * cos_w
+            if sin_elev <= 0.01:
+                irradiance.append(0.0)
+                continue
+            air_mass = 1.0 / sin_elev
+            direct = 1353.0 * 0.7 ** (air_mass ** 0.678)
+            # 산란광 약 10%를 더한 수평면 전일사량
+            irradiance.append(1.1 * direct * sin_elev * day_factor)
+
+    return irradiance
+
+
+def load_irradiance_csv(path: str, column: str = "ghi") -> list[float]:
+    """
+    CSV 파일에서 시간별 일사량 데이터를 읽습니다.
+
+    첫 줄은 헤더여야 하며, column 이름의 열(대소문자 무시)을 사용합니다.
+    해당 열이 없으면 마지막 열을 사용합니다. 빈 값은 0으로 처리합니다.
+
+    Args:
+        path: CSV 파일 경로
+        column: 일사량 열 이름 (W/m²)
+
+    Returns:
+        시간별 일사량 목록 (W/m²)
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [h.strip().lower() for h in next(reader)]
+        idx = header.index(column.lower()) if column.lower() in header else len(header) - 1
+        values = []
+        for row in reader:
+            if not row:
+                continue
+            cell = row[idx].strip()
+            values.append(max(0.0, float(cell)) if cell else 0.0)
+    return values
+
+
+# =============================================================================
+# 에너지 수지 계산
+# =============================================================================
+
+def hourly_load_ma(
+    load: Union[float, Sequence[float]],
+    hours: int,
+) -> list[float]:
+    """
+    부하 전류를 시뮬레이션 길이에 맞는 시간별 목록으로 변환합니다.
+
+    Args:
+        load: 고정 평균 전류 (mA), 24시간 프로파일, 또는 전체 시간별 목록
+        hours: 시뮬레이션 길이 (시간)
+
+    Returns:
+        시간별 부하 전류 목록 (mA)
+    """
+    if isinstance(load, (int, float)):
+        return [float(load)] * hours
+    profile = list(load)
+    if len(profile) == hours:
+        return profile
+    if len(profile) == HOURS_PER_DAY:
+        return (profile * (hours // HOURS_PER_DAY + 1))[:hours]
+    raise ValueError(
+        f"부하 프로파일 길이({len(profile)})는 24 또는 {hours}이어야 합니다."
+    )
+
+
+def harvest_ma_per_watt(
+    irradiance: Sequence[float],
+    battery_voltage: float,
+    charger_efficiency: float = CHARGER_EFFICIENCY,
+) -> list[float]:
+    """
+    패널 1W당 시간별 충전 전류를 계산합니다.
+
+    충전 전류(mA) = 패널 출력(W) x (일사량 / 1000) x 충전기 효율 / 배터리 전압 x 1000
+    패널 크기에 비례하므로, 스윕할 때 한 번만 계산해 두고 곱해서 사용합니다.
+
+    Args:
+        irradiance: 시간별 일사량 (W/m²)
+        battery_voltage: 배터리 공칭 전압 (V)
+        charger_efficiency: 충전기 효율 (0.0~1.0)
+
+    Returns:
+        패널 1W당 시간별 충전 전류 목록 (mA)
+    """
+    scale = charger_efficiency / STC_IRRADIANCE / battery_voltage * 1000.0
+    return [g * scale for g in irradiance]
+
+
+def _load_numpy():
+    """NumPy가 설치되어 있으면 모듈을, 없으면 None을 반환합니다."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def simulate_energy_balance(
+    load: Union[float, Sequence[float]],
+    battery: Battery,
+    panel: SolarPanel,
+    irradiance: Sequence[float],
+    charger_efficiency: float = CHARGER_EFFICIENCY,
+    initial_soc: float = 1.0,
+    keep_series: bool = False,
+) -> dict:
+    """
+    태양광 충전과 부하 방전을 합쳐 배터리 SoC를 시간 단위로 시뮬레이션합니다.
+
+    배터리 방전 전류는 부하 전류와 같다고 가정합니다 (LDO 사용 시
+    입력 전류 = 출력 전류). 잔량이 0 이하가 되는 첫 시점을 방전 시점으로
+    보고, 그 이후는 노드가 꺼진 것으로 간주합니다.
+
+    Args:
+        load: 평균 부하 전류 (mA) 또는 시간별/24시간 프로파일
+        battery: 배터리 정보
+        panel: 태양광 패널 정보
+        irradiance: 시간별 일사량 (W/m²)
+        charger_efficiency: 충전기 효율 (0.0~1.0)
+        initial_soc: 시작 충전 상태 (0.0~1.0)
+        keep_series: True이면 시간별 SoC(%) 목록을 결과에 포함
+
+    Returns:
+        시뮬레이션 결과 딕셔너리 (방전까지 일수, 최소 SoC 등)
+    """
+    return sweep_energy_balance(
+        load, [panel], [battery], irradiance, charger_efficiency, initial_soc, keep_series
+    )[0]
+
+
+def _panel_profiles(
+    unit: Sequence[float],
+    load_series: Sequence[float],
+    watts: Sequence[float],
+    np,
+):
+    """
+    패널별 누적 잔량 변화 S와 그 누적 최대값 M을 계산합니다.
+
+    충전 전류는 패널 출력에 비례하므로 S = W x cumsum(1W당 충전) - cumsum(부하)
+    입니다. S와 M은 배터리와 무관하므로 같은 전압의 배터리끼리 공유합니다.
+
+    Returns:
+        NumPy가 있으면 (패널 수 x 시간) 배열 (S, M),
+        없으면 패널별 (S, M) 목록
+    """
+    if np is not None:
+        harvest_cum = np.cumsum(np.asarray(unit, dtype=float))
+        load_cum = np.cumsum(np.asarray(load_series, dtype=float))
+        net = np.asarray(watts, dtype=float)[:, None] * harvest_cum - load_cum
+        return net, np.maximum.accumulate(net, axis=1)
+
+    harvest_cum = list(accumulate(unit))
+    load_cum = list(accumulate(load_series))
+    profiles = []
+    for w in watts:
+        net = list(map(sub, map(mul, harvest_cum, repeat(w)), load_cum))
+        profiles.append((net, list(accumulate(net, max))))
+    return profiles
+
+
+def _battery_levels(
+    net: list[float],
+    peak: list[float],
+    capacity: float,
+    initial: float,
+    keep_series: bool,
+) -> tuple:
+    """
+    패널 하나와 배터리 하나의 잔량 통계를 계산합니다 (NumPy 없는 경로).
+
+    누적 최대값 M은 감소하지 않으므로 포화 항 max(0, s0 + M - C)는
+    M이 C - s0를 처음 넘는 시점 k 이후에만 0이 아닙니다.
+        t < k : s[t] = s0 + S[t]
+        t >= k: s[t] = C + (S[t] - M[t])
+    k는 이분 탐색으로 찾고, 두 구간의 최소값만 구하므로 시간별 잔량 목록은
+    keep_series일 때만 만듭니다.
+
+    Returns:
+        (최소 잔량, 방전 시점 또는 None, 마지막 잔량, 시간별 잔량 목록 또는 None)
+    """
+    hours = len(net)
+    if not hours:
+        return initial, None, None, [] if keep_series else None
+    k = bisect_right(peak, capacity - initial)
+
+    def below_peak():
+        return map(sub, islice(net, k, None), islice(peak, k, None))
+
+    lowest = min(islice(net, k)) + initial if k else float("inf")
+    if k < hours:
+        lowest = min(lowest, min(below_peak()) + capacity)
+
+    empty_hour = None
+    if lowest <= 0.0:
+        empty_hour = next(compress(count(), map(le, islice(net, k), repeat(-initial))), None)
+        if empty_hour is None:
+            empty_hour = next(compress(count(k), map(le, below_peak(), repeat(-capacity))))
+
+    final = net[-1] + initial if k == hours else net[-1] - peak[-1] + capacity
+
+    series = None
+    if keep_series:
+        series = list(map(add, islice(net, k), repeat(initial)))
+        series.extend(map(add, below_peak(), repeat(capacity)))
+    return lowest, empty_hour, final, series
+
+
+def _summarize(
+    hours: int,
+    lowest: float,
+    empty_hour: Optional[int],
+    final: Optional[float],
+    series: Optional[Sequence[float]],
+    harvest_mah: float,
+    load_mah: float,
+    battery: Battery,
+    panel: SolarPanel,
+) -> dict:
+    """잔량 통계를 보고서용 결과 딕셔너리로 정리합니다."""
+    capacity = battery.capacity_mah
+    if empty_hour is None:
+        days_to_empty = float("inf")
+        min_soc = lowest / capacity * 100.0
+    else:
+        days_to_empty = (empty_hour + 1) / HOURS_PER_DAY
+        min_soc = 0.0
+    years = hours / HOURS_PER_YEAR if hours else 1.0
+
+    result = {
+        "battery_name": battery.name,
+        "capacity_mah": capacity,
+        "panel_name": panel.name,
+        "panel_w": panel.peak_power_w,
+        "hours": hours,
+        "days_to_empty": days_to_empty if math.isinf(days_to_empty) else round(days_to_empty, 2),
+        "min_soc_percent": round(min_soc, 1),
+        "final_soc_percent": round(max(final, 0.0) / capacity * 100.0, 1) if hours else 0.0,
+        "harvest_mah_per_year": round(harvest_mah / years, 1),
+        "load_mah_per_year": round(load_mah / years, 1),
+        "energy_neutral": empty_hour is None,
+    }
+    if series is not None:
+        result["soc_percent"] = [max(s, 0.0) / capacity * 100.0 for s in series]
+    return result
+
+
+def sweep_energy_balance(
+    load: Union[float, Sequence[float]],
+    panels: Sequence[SolarPanel],
+    batteries: Sequence[Battery],
+    irradiance: Sequence[float],
+    charger_efficiency: float = CHARGER_EFFICIENCY,
+    initial_soc: float = 1.0,
+    keep_series: bool = False,
+) -> list[dict]:
+    """
+    패널 x 배터리 조합 전체에 대해 에너지 수지를 시뮬레이션합니다.
+
+    용량에서 포화되는 잔량 점화식 s[t] = min(C, s[t-1] + d[t])은 루프 없이
+    다음과 같이 풀립니다:
+        P[t] = s0 + (d[1] + ... + d[t])       (누적합)
+        R[t] = max(C, P[1], ..., P[t])        (누적 최대값)
+        s[t] = C + P[t] - R[t]
+    d의 누적합을 S, S의 누적 최대값을 M이라 하면 P = s0 + S, R = max(C, s0 + M)
+    이므로
+        s[t] = s0 + S[t] - max(0, s0 + M[t] - C)
+    입니다. 0 이하로 내려가는 구간(방전)은 음수로 남기고 방전 시점은 따로
+    판정합니다. 패널별 S와 M은 배터리 전압별로 한 번만 계산합니다.
+    NumPy가 있으면 배터리마다 모든 패널의 잔량을 배열 연산 한 번으로 구하고,
+    없으면 _battery_levels()로 시간별 반복 없이 통계를 구합니다.
+
+    Args:
+        load: 평균 부하 전류 (mA) 또는 시간별/24시간 프로파일
+        panels: 비교할 태양광 패널 목록
+        batteries: 비교할 배터리 목록
+        irradiance: 시간별 일사량 (W/m²)
+        charger_efficiency: 충전기 효율 (0.0~1.0)
+        initial_soc: 시작 충전 상태 (0.0~1.0)
+        keep_series: True이면 시간별 SoC(%) 목록을 결과에 포함
+
+    Returns:
+        조합별 시뮬레이션 결과 목록 (배터리 순서, 그 안에서 패널 순서)
+    """
+    np = _load_numpy()
+    hours = len(irradiance)
+    load_series = hourly_load_ma(load, hours)
+    load_mah = sum(load_series)
+    watts = [panel.peak_power_w for panel in panels]
+    by_voltage: dict[float, tuple] = {}
+    results = []
+
+    for bat in batteries:
+        cached = by_voltage.get(bat.voltage)
+        if cached is None:
+            unit = harvest_ma_per_watt(irradiance, bat.voltage, charger_efficiency)
+            cached = (sum(unit), _panel_profiles(unit, load_series, watts, np))
+            by_voltage[bat.voltage] = cached
+        unit_total, profiles = cached
+
+        capacity = bat.capacity_mah
+        initial = capacity * initial_soc
+        if np is not None and hours:
+            net, peak = profiles
+            levels = initial + net - np.maximum(peak + (initial - capacity), 0.0)
+            empty = levels <= 0.0
+            any_empty = empty.any(axis=1).tolist()
+            first_empty = empty.argmax(axis=1).tolist()
+            lowest_all = levels.min(axis=1).tolist()
+            final_all = levels[:, -1].tolist()
+
+        for i, panel in enumerate(panels):
+            if np is None:
+                stats = _battery_levels(*profiles[i], capacity, initial, keep_series)
+            elif hours:
+                stats = (
+                    lowest_all[i],
+                    first_empty[i] if any_empty[i] else None,
+                    final_all[i],
+                    levels[i].tolist() if keep_series else None,
+                )
+            else:
+                stats = (initial, None, None, [] if keep_series else None)
+            results.append(_summarize(
+                hours, *stats, unit_total * panel.peak_power_w, load_mah, bat, panel,
+            ))
+    return results
+
+
+# =============================================================================
+# 보고서 출력
+# =============================================================================
+
+def print_energy_balance_report(
+    load: Union[float, Sequence[float]],
+    irradiance: Sequence[float],
+    panels: Sequence[SolarPanel] = SOLAR_PANELS,
+    batteries: Sequence[Battery] = (COMMON_BATTERIES[0], COMMON_BATTERIES[3]),
+    charger_efficiency: float = CHARGER_EFFICIENCY,
+    project_name: str = "태양광 센서 노드",
+) -> None:
+    """
+    패널/배터리 조합별 에너지 수지 보고서를 출력합니다.
+
+    Args:
+        load: 평균 부하 전류 (mA) 또는 시간별/24시간 프로파일
+        irradiance: 시간별 일사량 (W/m²)
+        panels: 비교할 태양광 패널 목록
+        batteries: 비교할 배터리 목록
+        charger_efficiency: 충전기 효율 (0.0~1.0)
+        project_name: 프로젝트 이름
+    """
+    years = len(irradiance) / HOURS_PER_YEAR
+    results = sweep_energy_balance(load, panels, batteries, irradiance, charger_efficiency)
+
+    print()
+    print_separator("=")
+    print(f"  태양광 에너지 수지: {project_name}")
+    print_separator("=")
+    print(f"  시뮬레이션 기간: {years:.1f}년 ({len(irradiance)}시간)")
+    print(f"  충전기 효율:     {charger_efficiency * 100:.0f}%")
+    print()
+    print(f"  {'배터리':<22} {'패널':<20} {'발전(mAh/년)':>13} {'최소 SoC':>9} {'방전까지(일)':>12}")
+    print(f"  {'-'*22} {'-'*20} {'-'*13} {'-'*9} {'-'*12}")
+
+    for r in results:
+        days = "방전 없음" if r["energy_neutral"] else f"{r['days_to_empty']:.1f}"
+        print(
+            f"  {r['battery_name']:<22} {r['panel_name']:<20} "
+            f"{r['harvest_mah_per_year']:>13.0f} {r['min_soc_percent']:>8.1f}% {days:>12}"
+        )
+
+    load_per_year = results[0]["load_mah_per_year"] if results else 0.0
+    print()
+    print(f"  * 부하 소비: {load_per_year:.0f} mAh/년")
+    print("  * 겨울철 연속 흐린 날이 최소 SoC를 결정합니다. 여유 있는 패널을 선택하세요.")
+    print("  * 리튬이온 배터리는 0도 이하에서 충전하면 안 됩니다 (충전 IC의 온도 보호 확인).")
+    print()
+
+
+def run_solar_example(csv_path: Optional[str] = None) -> None:
+    """
+    야외 환경 센서 노드 예제로 태양광 에너지 수지를 출력합니다.
+
+    프로젝트 구성:
+      - ESP32 (1% 시간 WiFi 활성, 나머지 딥 슬립)
+      - SHT30 + BMP280 (활성 구간에만 전원 공급)
+
+    Args:
+        csv_path: 시간별 일사량 CSV 경로 (None이면 합성 데이터 2년)
+    """
+    active = [
+        ESP32_MODES["active_wifi"],
+        COMPONENT_CATALOG["sht30"],
+        COMPONENT_CATALOG["bmp280"],
+    ]
+    sleep = [ESP32_MODES["deep_sleep"]]
+    duty = 0.01
+    avg_current = (
+        calculate_total_current(active) * duty
+        + calculate_total_current(sleep) * (1 - duty)
+    )
+
+    if csv_path:
+        irradiance = load_irradiance_csv(csv_path)
+        source = csv_path
+    else:
+        irradiance = synthetic_irradiance(years=2)
+        source = f"합성 모델 (위도 {DEFAULT_LATITUDE_DEG}도)"
+
+    print()
+    print("=" * 72)
+    print("  예제 프로젝트: 태양광 야외 환경 센서 노드")
+    print(f"  구성: ESP32(WiFi 1% / 딥슬립 99%) + SHT30 + BMP280, 평균 {avg_current:.2f} mA")
+    print(f"  일사량: {source}")
+    print("=" * 72)
+
+    print_energy_balance_report(avg_current, irradiance, project_name="야외 환경 센서 노드")
+
+
+if __name__ == "__main__":
+    run_solar_example(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+계산기 시작 시간 벤치마크
+=========================
+CI에서 계산기를 한 번 실행할 때 걸리는 시간(첫 결과까지의 벽시계 시간)과
+`python -X importtime`으로 측정한 모듈 불러오기 비용을 추적합니다.
+
+측정 항목:
+  - 빈 인터프리터 (python -c pass) : 이 환경에서 줄일 수 없는 기본 비용
+  - --json, -m 실행 (작은 BOM)     : 목표 시간과 비교하는 대상
+  - --json, 스크립트 실행          : 파일 경로로 실행할 때와의 비교
+  - --example, -m 실행             : 전체 보고서 출력
+  - 불러오기 비용 상위 모듈         : -X importtime 출력의 누적 시간 기준
+
+스크립트 경로로 실행하면 __main__ 모듈은 .pyc 캐시를 쓰지 않아 매번 소스를
+다시 컴파일합니다. `python -m power_budget_calculator`로 실행하면 캐시를
+사용하므로 CI에서는 -m 실행을 권장하며, 목표 시간도 이 방식으로 비교합니다.
+
+목표 시간(기본 50ms)은 작은 BOM의 --json 실행 중앙값과 비교하며,
+초과하면 종료 코드 1을 반환하므로 CI 단계로 그대로 사용할 수 있습니다.
+
+사용법:
+  python startup_benchmark.py              # 20회 측정, 목표 50ms
+  python startup_benchmark.py 50 40        # 50회 측정, 목표 40ms
+"""
+
+from statistics import median
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# =============================================================================
+# 설정
+# =============================================================================
+
+DEFAULT_RUNS = 20
+DEFAULT_TARGET_MS = 50.0
+
+# 불러오기 비용 보고서에 표시할 모듈 수
+TOP_IMPORTS = 8
+
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+CALCULATOR_MODULE = "power_budget_calculator"
+CALCULATOR_SCRIPT = os.path.join(EXAMPLES_DIR, CALCULATOR_MODULE + ".py")
+
+# 측정에 사용할 작은 BOM (예제 프로젝트와 같은 구성)
+SMALL_BOM = {
+    "components": [
+        {"esp32": "active_wifi"},
+        {"catalog": "sht30"},
+        {"catalog": "oled_ssd1306"},
+        {"catalog": "relay", "quantity": 2},
+    ],
+    "vin": 5.0,
+    "vout": 3.3,
+}
+
+
+# =============================================================================
+# 측정
+# =============================================================================
+
+def time_command(command: list[str], runs: int) -> list[float]:
+    """
+    명령을 여러 번 실행하여 회차별 벽시계 시간(ms)을 반환합니다.
+
+    Raises:
+        RuntimeError: 명령이 0이 아닌 종료 코드를 반환한 경우
+    """
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            command, cwd=EXAMPLES_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        samples.append((time.perf_counter() - start) * 1000.0)
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"명령 실패 ({proc.returncode}): {' '.join(command)}\n"
+                f"{proc.stderr.decode('utf-8', 'replace')}"
+            )
+    return samples
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """
+    `python -X importtime` 출력을 해석합니다.
+
+    각 줄의 형식: "import time: <self us> | <cumulative us> | <들여쓰기><모듈>"
+    들여쓰기가 없는 항목이 최상위 import이며, 그 누적 시간의 합이 전체
+    불러오기 비용입니다.
+
+    Returns:
+        [{"module", "self_us", "cumulative_us", "top_level"}, ...]
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 머리글 줄
+        name = fields[2].rstrip()
+        entries.append({
+            "module": name.strip(),
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+            "top_level": not name[1:].startswith(" "),
+        })
+    return entries
+
+
+def measure_imports(args: list[str], runs: int) -> list[dict]:
+    """
+    -X importtime으로 여러 번 실행하여 최상위 모듈별 누적 시간의 중앙값을 구합니다.
+
+    Returns:
+        누적 시간이 큰 순서로 정렬된 [{"module", "cumulative_us"}, ...]
+    """
+    per_module: dict[str, list[int]] = {}
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", CALCULATOR_MODULE, *args],
+            cwd=EXAMPLES_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        for e in parse_importtime(proc.stderr.decode("utf-8", "replace")):
+            if e["top_level"]:
+                per_module.setdefault(e["module"], []).append(e["cumulative_us"])
+    rows = [{"module": m, "cumulative_us": median(v)} for m, v in per_module.items()]
+    rows.sort(key=lambda r: r["cumulative_us"], reverse=True)
+    return rows
+
+
+def run_benchmark(runs: int = DEFAULT_RUNS, target_ms: float = DEFAULT_TARGET_MS) -> dict:
+    """
+    시작 시간 벤치마크를 실행합니다.
+
+    Args:
+        runs: 항목별 실행 횟수
+        target_ms: --json (작은 BOM, -m 실행) 중앙값의 목표 시간 (ms)
+
+    Returns:
+        항목별 측정값과 목표 달성 여부 딕셔너리
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+        json.dump(SMALL_BOM, f)
+        bom_path = f.name
+    try:
+        # 디스크 캐시와 .pyc 생성을 측정에서 제외하기 위한 예열 실행
+        time_command([sys.executable, "-m", CALCULATOR_MODULE, "--json", bom_path], 1)
+
+        cases = {
+            "빈 인터프리터": [sys.executable, "-c", "pass"],
+            "--json (-m 실행)": [sys.executable, "-m", CALCULATOR_MODULE, "--json", bom_path],
+            "--json (스크립트 실행)": [sys.executable, CALCULATOR_SCRIPT, "--json", bom_path],
+            "--example (-m 실행)": [sys.executable, "-m", CALCULATOR_MODULE, "--example"],
+        }
+        timings = {}
+        for label, command in cases.items():
+            samples = time_command(command, runs)
+            timings[label] = {"median_ms": median(samples), "min_ms": min(samples)}
+
+        imports = measure_imports(["--json", bom_path], max(3, runs // 4))
+    finally:
+        os.unlink(bom_path)
+
+    first_result = timings["--json (-m 실행)"]["median_ms"]
+    return {
+        "runs": runs,
+        "target_ms": target_ms,
+        "timings": timings,
+        "interpreter_ms": timings["빈 인터프리터"]["median_ms"],
+        "first_result_ms": first_result,
+        "import_total_ms": sum(r["cumulative_us"] for r in imports) / 1000.0,
+        "imports": imports,
+        "passed": first_result <= target_ms,
+    }
+
+
+# =============================================================================
+# 보고서 출력
+# =============================================================================
+
+def print_benchmark_report(result: dict) -> None:
+    """벤치마크 결과를 출력합니다."""
+    print()
+    print("=" * 70)
+    print(f"  시작 시간 벤치마크 ({result['runs']}회, {sys.version.split()[0]})")
+    print("=" * 70)
+    print(f"  {'항목':<24} {'중앙값':>10} {'최소':>10}")
+    print(f"  {'-'*24} {'-'*10} {'-'*10}")
+    for label, t in result["timings"].items():
+        print(f"  {label:<24} {t['median_ms']:>8.1f}ms {t['min_ms']:>8.1f}ms")
+    print()
+    print("[ 불러오기 비용 (-X importtime, 최상위 모듈 누적 시간) ]")
+    print("-" * 70)
+    for r in result["imports"][:TOP_IMPORTS]:
+        print(f"  {r['module']:<40} {r['cumulative_us'] / 1000.0:>8.2f}ms")
+    print(f"  {'합계':<40} {result['import_total_ms']:>8.2f}ms")
+    print()
+    status = "달성" if result["passed"] else "초과"
+    overhead = result["first_result_ms"] - result["interpreter_ms"]
+    print(f"  첫 결과까지: {result['first_result_ms']:.1f}ms / 목표 {result['target_ms']:.0f}ms -> {status}")
+    print(f"  (빈 인터프리터 대비 추가 시간: {overhead:.1f}ms)")
+    print()
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    target = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TARGET_MS
+    report = run_benchmark(runs, target)
+    print_benchmark_report(report)
+    sys.exit(0 if report["passed"] else 1)